@@ -2,23 +2,14 @@
 """
 Streamlit application entry point for deployment.
 
-This file is used by Streamlit Cloud to run the application.
+This file is used by Streamlit Cloud to run the application. Streamlit puts
+the script's directory on sys.path itself, so `app` resolves to the package.
 """
 import os
-import sys
-from pathlib import Path
 
-# Add the app directory to the Python path
-app_dir = str(Path(__file__).parent / "app")
-if app_dir not in sys.path:
-    sys.path.insert(0, app_dir)
-
-# Import the main app
-from app import main
+# Set before anything can import streamlit so its config sees the flag on first read
+os.environ.setdefault("STREAMLIT_SERVER_HEADLESS", "true")
 
 if __name__ == "__main__":
-    # Set the STREAMLIT_SERVER_HEADLESS environment variable
-    os.environ["STREAMLIT_SERVER_HEADLESS"] = "true"
-    
-    # Run the Streamlit app
+    from app.__main__ import main
     main()
@@ -3,34 +3,67 @@ Conga to Box DocGen Converter
 
 This package provides tools for converting Conga templates to Box DocGen templates,
 including parsing, conversion, validation, and export functionality.
+
+Public names are resolved lazily on first attribute access, so ``import app``
+does not load boxsdk, python-docx or any of the submodules until they are used.
 """
+import importlib
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, Tuple
+
+# Public names grouped by the submodule (relative to this package) that defines them
+_SUBMODULE_ATTRS = {
+    '.box_ai_client': ('BoxAIClient', 'AsyncBoxAIClient', 'BoxAIClientError', 'BoxAuthError', 'AuthMethod'),
+    '.conversion_engine': ('ConversionEngine',),
+    '.exporter': ('DocxExporter',),
+    '.parser': ('CongaTemplateParser',),
+    '.prompt_builder': ('PromptBuilder', 'ConversionContext'),
+    '.query_loader': ('CongaQueryLoader',),
+    '.response_parser': ('AIResponseParser',),
+    '.schema_loader': ('JSONSchemaLoader',)
+}
+
+# Read-only so the lookup table used by __getattr__ cannot drift at runtime
+_MODULE_FOR = MappingProxyType({
+    attr: module_name
+    for module_name, attrs in _SUBMODULE_ATTRS.items()
+    for attr in attrs
+})
 
 # Define __all__ for public API
-__all__ = [
-    'BoxAIClient',
-    'BoxAIClientError',
-    'BoxAuthError',
-    'AuthMethod',
-    'ConversionEngine',
-    'DocxExporter',
-    'CongaTemplateParser',
-    'PromptBuilder',
-    'ConversionContext',
-    'CongaQueryLoader',
-    'AIResponseParser',
-    'JSONSchemaLoader'
-]
-
-# Import modules directly to avoid lazy loading issues
-from .box_ai_client import BoxAIClient, BoxAIClientError, BoxAuthError, AuthMethod
-from .prompt_builder import PromptBuilder, ConversionContext
-from .response_parser import AIResponseParser
-from .exporter import DocxExporter
-from .query_loader import CongaQueryLoader
-from .parser import CongaTemplateParser
-from .conversion_engine import ConversionEngine
-
-try:
+__all__ = tuple(_MODULE_FOR)
+
+# Names whose submodule may be unavailable; they resolve to None instead of raising
+_OPTIONAL = frozenset({'JSONSchemaLoader'})
+
+if TYPE_CHECKING:
+    from .box_ai_client import BoxAIClient, AsyncBoxAIClient, BoxAIClientError, BoxAuthError, AuthMethod
+    from .conversion_engine import ConversionEngine
+    from .exporter import DocxExporter
+    from .parser import CongaTemplateParser
+    from .prompt_builder import PromptBuilder, ConversionContext
+    from .query_loader import CongaQueryLoader
+    from .response_parser import AIResponseParser
     from .schema_loader import JSONSchemaLoader
-except ImportError:
-    JSONSchemaLoader = None  # type: ignore
+
+
+def __getattr__(name: str) -> Any:
+    """Import the submodule defining ``name`` on first access and cache the result."""
+    module_name = _MODULE_FOR.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    try:
+        value = getattr(importlib.import_module(module_name, __name__), name)
+    except ImportError:
+        if name not in _OPTIONAL:
+            raise
+        value = None  # type: ignore
+
+    # Cache the result (including a missing optional) so the import is attempted once
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> Tuple[str, ...]:
+    return __all__
@@ -0,0 +1,29 @@
+from .box_ai_client import AsyncBoxAIClient as AsyncBoxAIClient
+from .box_ai_client import AuthMethod as AuthMethod
+from .box_ai_client import BoxAIClient as BoxAIClient
+from .box_ai_client import BoxAIClientError as BoxAIClientError
+from .box_ai_client import BoxAuthError as BoxAuthError
+from .conversion_engine import ConversionEngine as ConversionEngine
+from .exporter import DocxExporter as DocxExporter
+from .parser import CongaTemplateParser as CongaTemplateParser
+from .prompt_builder import ConversionContext as ConversionContext
+from .prompt_builder import PromptBuilder as PromptBuilder
+from .query_loader import CongaQueryLoader as CongaQueryLoader
+from .response_parser import AIResponseParser as AIResponseParser
+from .schema_loader import JSONSchemaLoader as JSONSchemaLoader
+
+__all__ = (
+    'BoxAIClient',
+    'AsyncBoxAIClient',
+    'BoxAIClientError',
+    'BoxAuthError',
+    'AuthMethod',
+    'ConversionEngine',
+    'DocxExporter',
+    'CongaTemplateParser',
+    'PromptBuilder',
+    'ConversionContext',
+    'CongaQueryLoader',
+    'AIResponseParser',
+    'JSONSchemaLoader',
+)
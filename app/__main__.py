@@ -1,7 +1,17 @@
 """
 Main entry point for the Conga to Box DocGen converter application.
 """
-from .app import main
+import os
+
+
+def main() -> None:
+    """Run the Streamlit application in headless mode."""
+    # Set STREAMLIT_SERVER_HEADLESS before .app imports streamlit, keeping any explicit value
+    os.environ.setdefault("STREAMLIT_SERVER_HEADLESS", "true")
+    
+    from .app import main as run_app
+    run_app()
+
 
 if __name__ == "__main__":
     main()
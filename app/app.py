@@ -1,256 +1,396 @@
 """
 Main Streamlit application for Conga to Box DocGen template conversion
 """
+import functools
+import hashlib
+import importlib
 import io
 import json
+import multiprocessing
 import os
-import tempfile
+import threading
+import time
 import zipfile
-from pathlib import Path
-from typing import Dict, List, Optional, Any, Union, Tuple
+from concurrent.futures import Future, ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+from typing import TYPE_CHECKING, Dict, List, Optional, Any, Union, Tuple
 
 import streamlit as st
-from docx import Document
 
-# Box SDK imports
-from boxsdk import Client
-from boxsdk.exception import BoxException
+# Prefer orjson for parsing and fingerprinting schemas; fall back to the standard library
+try:
+    import orjson
+    _loads = orjson.loads
+
+    def _dumps_sorted(data: Any) -> bytes:
+        return orjson.dumps(data, option=orjson.OPT_SORT_KEYS)
+except ImportError:
+    _loads = json.loads
+
+    def _dumps_sorted(data: Any) -> bytes:
+        return json.dumps(data, sort_keys=True, separators=(',', ':')).encode('utf-8')
+
+def _local_module(name: str) -> Any:
+    """
+    Import one of this package's modules
+    
+    Works both when app.py is imported as part of the package and when
+    Streamlit runs it as a top-level script next to its sibling modules.
+    
+    Args:
+        name: Module name without the package prefix
+        
+    Returns:
+        The imported module
+    """
+    try:
+        return importlib.import_module(f'app.{name}')
+    except ImportError:
+        return importlib.import_module(name)
+
+def _box_ai_client_module() -> Any:
+    """
+    Import the Box AI client module, and with it boxsdk, on first use
+    
+    Returns:
+        The box_ai_client module
+    """
+    return _local_module('box_ai_client')
 
 # Local application imports
 # Import in the order of dependency to avoid circular imports
 
+# box_ai_client pulls in boxsdk, the slowest import here; it is loaded on first
+# use (or by warm_deferred_imports after first paint) via _box_ai_client_module
+if TYPE_CHECKING:
+    from app.box_ai_client import BoxAIClient
+
 # First, import modules that don't have internal dependencies
-try:
-    from app.box_ai_client import BoxAIClient, BoxAIClientError, BoxAuthError, AuthMethod
-except ImportError:
-    from box_ai_client import BoxAIClient, BoxAIClientError, BoxAuthError, AuthMethod
+_prompt_builder = _local_module('prompt_builder')
+PromptBuilder = _prompt_builder.PromptBuilder
+ConversionContext = _prompt_builder.ConversionContext
+PROMPT_VERSION = _prompt_builder.PROMPT_VERSION
 
-try:
-    from app.prompt_builder import PromptBuilder, ConversionContext
-except ImportError:
-    from prompt_builder import PromptBuilder, ConversionContext
+AIResponseParser = _local_module('response_parser').AIResponseParser
 
-try:
-    from app.response_parser import AIResponseParser
-except ImportError:
-    from response_parser import AIResponseParser
+_docx_text = _local_module('docx_text')
+docx_paragraph_texts = _docx_text.docx_paragraph_texts
+docx_body_texts = _docx_text.docx_body_texts
+doc_to_text = _docx_text.doc_to_text
 
 # Then import modules that might depend on the above
-try:
-    from app.exporter import DocxExporter
-except ImportError:
-    from exporter import DocxExporter
-
-try:
-    from app.query_loader import CongaQueryLoader
-except ImportError:
-    from query_loader import CongaQueryLoader
-
-try:
-    from app.parser import CongaTemplateParser
-except ImportError:
-    from parser import CongaTemplateParser
+DocxExporter = _local_module('exporter').DocxExporter
+CongaQueryLoader = _local_module('query_loader').CongaQueryLoader
+CongaTemplateParser = _local_module('parser').CongaTemplateParser
 
 # Import conversion_engine last as it might depend on other modules
-try:
-    from app.conversion_engine import ConversionEngine
-except ImportError:
-    from conversion_engine import ConversionEngine
+_conversion_engine = _local_module('conversion_engine')
+ConversionEngine = _conversion_engine.ConversionEngine
+AI_MAX_TOKENS = _conversion_engine.AI_MAX_TOKENS
+convert_docx_bytes = _conversion_engine.convert_docx_bytes
 
-try:
-    from .schema_loader import JSONSchemaLoader
-except ImportError:
-    from schema_loader import JSONSchemaLoader
+DocGenTemplateGenerator = _local_module('template_generator').DocGenTemplateGenerator
+_validation_engine = _local_module('validation_engine')
+ValidationEngine = _validation_engine.ValidationEngine
+AI_FALLBACK_METHOD = _validation_engine.AI_FALLBACK_METHOD
 
-try:
-    from .template_generator import DocGenTemplateGenerator
-except ImportError:
-    from template_generator import DocGenTemplateGenerator
+@st.cache_resource(show_spinner=False)
+def get_box_ai_client(auth_config: Dict[str, Any]) -> 'BoxAIClient':
+    """
+    Get a Box AI client for the given configuration, shared across reruns
+    
+    Args:
+        auth_config: Authentication configuration for Box API
+        
+    Returns:
+        Authenticated BoxAIClient
+    """
+    return _box_ai_client_module().BoxAIClient(auth_config)
 
-try:
-    from .validation_engine import ValidationEngine
-except ImportError:
-    from validation_engine import ValidationEngine
+@st.cache_resource(show_spinner=False)
+def get_conversion_components(
+    auth_config: Optional[Dict[str, Any]] = None
+) -> Tuple[ConversionEngine, ValidationEngine]:
+    """
+    Get the conversion and validation engines, shared across reruns
+    
+    Only stateless components are shared; a DocGenTemplateGenerator holds the
+    document being built, so each conversion creates its own.
+    
+    Args:
+        auth_config: Authentication configuration for Box API, or None for rule-based only
+        
+    Returns:
+        Tuple of (ConversionEngine, ValidationEngine)
+    """
+    box_ai_client = get_box_ai_client(auth_config) if auth_config else None
+    return (
+        ConversionEngine(box_ai_client=box_ai_client),
+        ValidationEngine(box_ai_client=box_ai_client)
+    )
 
-def initialize_session_state():
-    """Initialize session state variables"""
-    if 'schema_data' not in st.session_state:
-        st.session_state.schema_data = None
-    if 'conversion_results' not in st.session_state:
-        st.session_state.conversion_results = None
-    if 'error' not in st.session_state:
-        st.session_state.error = None
-    if 'success' not in st.session_state:
-        st.session_state.success = None
-    if 'converted_files' not in st.session_state:
-        st.session_state.converted_files = []
-    if 'processing' not in st.session_state:
-        st.session_state.processing = False
-
-def get_auth_config():
-    """Get authentication configuration from Streamlit Secrets"""
-    if 'BOX_DEVELOPER_TOKEN' not in st.secrets:
-        st.error("Box Developer Token not found in Streamlit Secrets")
-        st.stop()
+def schema_fingerprint(schema_data: Optional[Dict[str, Any]]) -> str:
+    """
+    Compute a stable cache key for a schema
+    
+    Streamlit hashes dict arguments by walking them in Python; serializing with
+    orjson (or the C JSON encoder) and hashing with blake2b is much cheaper for
+    large schemas.
+    
+    Args:
+        schema_data: JSON schema data, or None
+        
+    Returns:
+        Hex digest identifying the schema content
+    """
+    if not schema_data:
+        return ""
+    return hashlib.blake2b(_dumps_sorted(schema_data), digest_size=16).hexdigest()
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def ai_convert(
+    auth_config: Dict[str, Any],
+    template_text: str,
+    query_text: str,
+    schema_key: str,
+    _schema_data: Optional[Dict[str, Any]],
+    custom_instructions: str,
+    prompt_version: int
+) -> Dict[str, Any]:
+    """
+    Convert a template with Box AI, reusing the result for identical inputs
+    
+    Args:
+        auth_config: Authentication configuration for Box API
+        template_text: Conga template text
+        query_text: Conga SOQL query text
+        schema_key: schema_fingerprint() of the schema, used as its cache key
+        _schema_data: JSON schema data for field mapping; not hashed by Streamlit
+        custom_instructions: Custom instructions for the conversion
+        prompt_version: PROMPT_VERSION, so prompt changes invalidate cached results
+        
+    Returns:
+        Dict with 'converted_content' and the 'raw_response' from Box AI
+    """
+    context = ConversionContext(
+        template_text=template_text,
+        query_text=query_text,
+        schema_data=_schema_data,
+        custom_instructions=custom_instructions
+    )
+    prompt = PromptBuilder(context).build_conversion_prompt()
+    
+    response = get_box_ai_client(auth_config).generate_text(
+        prompt=prompt['user_prompt'],
+        system_prompt=prompt['system_prompt'],
+        max_tokens=AI_MAX_TOKENS
+    )
     
     return {
-        'developer_token': st.secrets['BOX_DEVELOPER_TOKEN'],
-        'auth_method': AuthMethod.DEVELOPER_TOKEN
+        'converted_content': AIResponseParser.parse_conversion_result(response.get('answer', ''))['content'],
+        'raw_response': response
     }
 
-def render_sidebar():
-    """Render the sidebar with configuration options"""
-    with st.sidebar:
-        # Schema upload
-        st.subheader("Schema Configuration")
-        schema_file = st.file_uploader(
-            "Upload Box-Salesforce JSON Schema (optional)",
-            type=["json"],
-            help="Upload a JSON schema file for better field mapping"
-        )
-        
-        if schema_file:
-            try:
-                st.session_state.schema_data = json.load(schema_file)
-                st.success("Schema loaded successfully!")
-            except Exception as e:
-                st.error(f"Error loading schema: {str(e)}")
-        
-        # Processing options
-        st.subheader("Processing Options")
-        use_ai = st.checkbox(
-            "Enable AI-assisted conversion",
-            value=True,
-            help="Use Box AI for complex conversions"
-        )
-        
-        validate_output = st.checkbox(
-            "Validate output",
-            value=True,
-            help="Validate the converted template"
-        )
+def text_fingerprint(text: str) -> str:
+    """
+    Compute a short cache key for a block of template text
+    
+    Args:
+        text: Template text
         
-        return use_ai, validate_output
+    Returns:
+        Hex digest identifying the text
+    """
+    return hashlib.blake2b(text.encode('utf-8'), digest_size=16).hexdigest()
 
-def main():
-    """Main application function."""
-    st.set_page_config(
-        page_title="Conga to Box DocGen Converter",
-        page_icon="🔄",
-        layout="wide",
-        initial_sidebar_state="expanded"
-    )
+class _UncachedResult(Exception):
+    """Carries a result out of a cached function so Streamlit does not store it."""
     
-    # Initialize session state
-    initialize_session_state()
+    def __init__(self, result: Any):
+        super().__init__()
+        self.result = result
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def _cached_validation(
+    auth_config: Optional[Dict[str, Any]],
+    original_key: str,
+    converted_key: str,
+    _original_text: str,
+    _converted_text: str
+) -> Dict[str, Any]:
+    """
+    Validate a conversion, caching only results that did not fall back from AI to rules
+    
+    Raises:
+        _UncachedResult: Holding the results, when AI validation fell back to the rules
+    """
+    validator = get_conversion_components(auth_config)[1]
+    results = validator.validate_conversion(_original_text, _converted_text, {})
+    if results.get('validation_method') == AI_FALLBACK_METHOD:
+        raise _UncachedResult(results)
+    return results
+
+def validate_conversion(
+    auth_config: Optional[Dict[str, Any]],
+    original_key: str,
+    converted_key: str,
+    original_text: str,
+    converted_text: str
+) -> Dict[str, Any]:
+    """
+    Validate a conversion, reusing the result for an unchanged template pair
     
-    # Show configuration in sidebar
-    use_ai, validate_output = render_sidebar()
+    Results where Box AI failed and the rules were used instead are not
+    reused, so the next call tries AI validation again.
     
-    # Get authentication config
+    Args:
+        auth_config: Authentication configuration when AI validation is used, else None
+        original_key: text_fingerprint() of the original template text
+        converted_key: text_fingerprint() of the converted template text
+        original_text: Original template text
+        converted_text: Converted template text
+        
+    Returns:
+        Validation results from ValidationEngine.validate_conversion
+    """
     try:
-        auth_config = get_auth_config()
-    except Exception as e:
-        st.error(f"Authentication error: {str(e)}")
-        st.stop()
-    
-    # Main app UI
-    st.title("Conga to Box DocGen Converter")
+        return _cached_validation(auth_config, original_key, converted_key, original_text, converted_text)
+    except _UncachedResult as e:
+        return e.result
+
+@st.cache_data(show_spinner=False)
+def load_schema(raw: bytes) -> Dict[str, Any]:
+    """
+    Parse an uploaded JSON schema once per distinct file content
     
-    # File upload section
-    st.header("Upload Conga Template")
-    uploaded_file = st.file_uploader(
-        "Upload your Conga template (DOCX or ZIP)",
-        type=["docx", "zip"],
-        accept_multiple_files=False,
-        help="Upload a single DOCX file or a ZIP file containing multiple DOCX files"
-    )
+    Args:
+        raw: Bytes of the uploaded schema file
+        
+    Returns:
+        Parsed schema dictionary
+    """
+    return _loads(raw)
+
+@st.cache_data(show_spinner=False)
+def extract_paragraph_text(docx_bytes: bytes) -> str:
+    """
+    Extract the non-empty paragraph text of a DOCX file, once per distinct content
     
-    # Process button
-    if uploaded_file is not None and st.button("Convert to Box DocGen"):
-        with st.spinner("Processing template..."):
-            try:
-                # Process the uploaded file
-                process_conversion(
-                    uploaded_file=uploaded_file,
-                    schema_data=st.session_state.schema_data,
-                    use_ai=use_ai,
-                    validate_output=validate_output,
-                    auth_config=auth_config
-                )
-                st.session_state.success = "Conversion completed successfully!"
-            except Exception as e:
-                st.session_state.error = f"Error during conversion: {str(e)}"
-                st.error(st.session_state.error)
+    Args:
+        docx_bytes: Bytes of the DOCX file
+        
+    Returns:
+        Paragraph text joined with newlines
+    """
+    return "\n".join(docx_paragraph_texts(docx_bytes, skip_blank=True))
+
+@st.cache_data(show_spinner=False)
+def extract_file_paragraph_text(path: str, mtime: float, size: int) -> str:
+    """
+    Extract the non-empty paragraph text of a DOCX file on disk, once per file version
     
-    # Show success message if conversion was successful
-    if st.session_state.success:
-        st.success(st.session_state.success)
+    Args:
+        path: Path to the DOCX file
+        mtime: Modification time of the file, so edits invalidate the entry
+        size: Size of the file in bytes
+        
+    Returns:
+        Paragraph text joined with newlines
+    """
+    with open(path, 'rb') as f:
+        return extract_paragraph_text(f.read())
+
+def get_uploaded_schema(schema_file: Any) -> Dict[str, Any]:
+    """
+    Get the parsed schema for an uploaded file, parsing only when a new file arrives
     
-    # Show conversion results if available
-    if st.session_state.conversion_results:
-        show_conversion_results()
+    Unchanged uploads are served from session state, so reruns neither hash the
+    file bytes nor copy the cached result again.
     
-    # Main content area
-    st.title("Conga to Box DocGen Template Converter")
-    st.markdown("""
-    Upload a Conga template file or paste a Conga SOQL query to convert it to a Box DocGen template.
-    """)
+    Args:
+        schema_file: Streamlit UploadedFile holding the JSON schema
+        
+    Returns:
+        Parsed schema dictionary
+    """
+    if st.session_state.get('schema_file_id') != schema_file.file_id:
+        st.session_state.schema_data = load_schema(schema_file.getvalue())
+        st.session_state.schema_file_id = schema_file.file_id
+    return st.session_state.schema_data
 
-    # File upload or query input
-    tab1, tab2 = st.tabs(["Upload Template File", "Paste SOQL Query"])
+# Upper bound on worker processes converting batch files in parallel
+BATCH_MAX_WORKERS = 8
 
-    with tab1:
-        uploaded_file = st.file_uploader(
-            "Upload a Conga template file (DOCX, PPTX, or XLSX)",
-            type=["docx", "pptx", "xlsx"],
-            key="template_uploader"
-        )
-        query_text = ""
+# Minimum seconds between batch progress updates, so large batches don't spend
+# their time re-rendering the progress bar
+PROGRESS_UPDATE_INTERVAL = 0.1
 
-    with tab2:
-        query_text = st.text_area(
-            "Paste your Conga SOQL query here",
-            height=200,
-            help="Example: SELECT Id, Name FROM Account"
-        )
-        uploaded_file = None
+# Number of process_conversion results each session keeps for reruns with the same inputs
+SESSION_RESULT_CACHE_SIZE = 16
 
-    # Custom instructions
-    custom_instructions = st.text_area(
-        "Custom Instructions (optional)",
-        help="Provide any specific instructions for the conversion"
-    )
+# Number of converted uploads kept in memory, so re-running an unchanged file is instant
+CONVERSION_CACHE_SIZE = 32
 
-    # Convert button
-    if st.button("Convert to Box DocGen", type="primary"):
-        if not uploaded_file and not query_text.strip():
-            st.error("Please upload a file or paste a SOQL query")
-            return
+# Batch conversion results by blake2b digest of the upload, oldest first; shared
+# by all sessions, like _convert_file's cache
+_BATCH_RESULTS: Dict[bytes, Tuple[bytes, str, str]] = {}
+_BATCH_RESULTS_LOCK = threading.Lock()
 
-        if not st.session_state.auth_config:
-            st.error("Please configure authentication first")
-            return
+# Modules imported only inside functions; loaded in the background after first paint
+_WARM_IMPORTS = (
+    'app.box_ai_client',
+    'boxsdk.auth.jwt_auth',
+)
 
+def _import_quietly(module_names: Tuple[str, ...]) -> None:
+    """
+    Import each module, ignoring ones whose optional dependencies are missing
+    
+    Args:
+        module_names: Fully qualified module names to import
+    """
+    for module_name in module_names:
         try:
-            with st.spinner("Converting template..."):
-                process_conversion(
-                    uploaded_file=uploaded_file,
-                    query_text=query_text,
-                    schema_data=st.session_state.schema_data,
-                    use_ai=use_ai,
-                    validate_output=validate_output,
-                    auth_config=st.session_state.auth_config,
-                    custom_instructions=custom_instructions
-                )
-                # Refresh the page to show results
-                st.rerun()
-                
-        except BoxAuthError as e:
-            st.error(f"Authentication error: {str(e)}")
-        except Exception as e:
-            st.error(f"An error occurred during conversion: {str(e)}")
-            st.exception(e)  # This will show the full traceback in the app
+            importlib.import_module(module_name)
+        except ImportError:
+            pass
+
+@st.cache_resource(show_spinner=False)
+def warm_deferred_imports() -> threading.Thread:
+    """
+    Start importing deferred modules in a daemon thread, once per process
+    
+    Returns:
+        The started warm-up thread
+    """
+    thread = threading.Thread(target=_import_quietly, args=(_WARM_IMPORTS,), daemon=True)
+    thread.start()
+    return thread
+
+@st.cache_resource(show_spinner=False)
+def get_conversion_pool() -> ProcessPoolExecutor:
+    """
+    Get the process pool that converts batch files, created once per server process
+    
+    Workers are spawned rather than forked, since forking the threaded
+    Streamlit server is unsafe; they import only the conversion modules.
+    
+    Returns:
+        Shared process pool
+    """
+    return ProcessPoolExecutor(
+        max_workers=min(BATCH_MAX_WORKERS, os.cpu_count() or 1),
+        mp_context=multiprocessing.get_context('spawn')
+    )
+
+def initialize_session_state() -> None:
+    """Initialize session state variables"""
+    if 'converted_doc' not in st.session_state:
+        st.session_state.converted_doc = None
+    if 'validation_results' not in st.session_state:
+        st.session_state.validation_results = {}
+    if 'box_ai_client' not in st.session_state:
+        st.session_state.box_ai_client = None
 
 
 def process_conversion(
@@ -282,33 +422,37 @@ def process_conversion(
             return
             
         try:
-            box_ai_client = BoxAIClient(auth_config)
+            box_ai_client = get_box_ai_client(auth_config)
             st.session_state.box_ai_client = box_ai_client
-        except BoxAuthError as e:
+        except _box_ai_client_module().BoxAuthError as e:
             st.error(f"Failed to authenticate with Box: {str(e)}")
             return
         except Exception as e:
             st.error(f"Failed to initialize Box AI client: {str(e)}")
             return
     
-    # Initialize other components
-    schema_loader = JSONSchemaLoader(schema_data) if schema_data else None
+    # Share the stateless converter; the template generator holds per-conversion state
+    converter = get_conversion_components(auth_config if use_ai else None)[0]
     template_generator = DocGenTemplateGenerator()
     
     # Process template file if provided
     template_content = ""
+    template_name = "template.docx"
     if uploaded_file:
         try:
             # Handle both file path and file-like objects
             if hasattr(uploaded_file, 'read'):
-                doc = Document(io.BytesIO(uploaded_file.getvalue()))
+                template_content = extract_paragraph_text(uploaded_file.getvalue())
+                template_name = getattr(uploaded_file, 'name', template_name)
             else:
-                doc = Document(uploaded_file)
-                
-            template_content = "\n".join([p.text for p in doc.paragraphs if p.text.strip()])
+                file_stat = os.stat(uploaded_file)
+                template_content = extract_file_paragraph_text(
+                    uploaded_file, file_stat.st_mtime, file_stat.st_size
+                )
+                template_name = os.path.basename(uploaded_file)
             
             # Store the uploaded file info in session state
-            st.session_state.uploaded_file_name = uploaded_file.name
+            st.session_state.uploaded_file_name = template_name
             
         except Exception as e:
             st.error(f"Error reading template file: {str(e)}")
@@ -331,34 +475,46 @@ def process_conversion(
         st.error("Please provide either a template file or a SOQL query")
         return
     
-    # Build the conversion context
-    context = ConversionContext(
-        template_text=template_content,
-        query_text=query_text,
-        schema_data=schema_data,
-        custom_instructions=custom_instructions
-    )
+    output_name = f"converted_{template_name}"
+    
+    # Reuse this session's result for identical inputs, most recently used last;
+    # AI results also depend on the credentials, which are keyed by digest only
+    auth_key = ""
+    if use_ai and auth_config:
+        auth_key = hashlib.blake2b(_dumps_sorted(auth_config), digest_size=16).hexdigest()
+    result_key = text_fingerprint("\0".join((
+        template_content,
+        query_text or "",
+        schema_fingerprint(schema_data),
+        custom_instructions or "",
+        auth_key,
+        str(use_ai),
+        str(validate_output),
+        str(PROMPT_VERSION)
+    )))
+    session_results = st.session_state.setdefault('_conversion_results', {})
+    if result_key in session_results:
+        output_bytes, validation_results = session_results[result_key] = session_results.pop(result_key)
+        st.session_state.converted_doc = output_bytes
+        st.session_state.converted_doc_name = output_name
+        st.session_state.validation_results = validation_results
+        return
     
     # Process the conversion
     try:
         if use_ai and box_ai_client:
-            # Build the prompt
-            prompt_builder = PromptBuilder(context)
-            prompt = prompt_builder.build_conversion_prompt()
-            
-            # Use AI for conversion
-            response = box_ai_client.generate_text(
-                prompt=prompt['user_prompt'],
-                system_prompt=prompt['system_prompt'],
-                max_tokens=4000
-            )
-            
-            # Parse the AI response
-            parsed_response = AIResponseParser.parse_conversion_result(response)
-            converted_content = parsed_response['content']
+            # Use AI for conversion; identical inputs are served from the cache
+            converted_content = ai_convert(
+                auth_config,
+                template_content,
+                query_text,
+                schema_fingerprint(schema_data),
+                schema_data,
+                custom_instructions,
+                prompt_version=PROMPT_VERSION
+            )['converted_content']
         else:
             # Fall back to rule-based conversion
-            converter = ConversionEngine(box_ai_client=box_ai_client)
             if template_content:
                 converted_content = converter.convert_text(template_content)
             else:
@@ -367,95 +523,42 @@ def process_conversion(
         # Generate the output document
         output_doc = template_generator.create_from_ai_output(converted_content)
         
-        # Save the output to a temporary file
-        with tempfile.NamedTemporaryFile(delete=False, suffix='.docx') as tmp_file:
-            output_path = tmp_file.name
-        
-        template_generator.save_to_file(output_doc, output_path)
+        # Keep the output in memory; it is only written out by the download button
+        output_bytes = template_generator.to_bytes(output_doc)
         
         # Validate the output if requested
         validation_results = {}
-        if validate_output:
+        validation_failed = False
+        if validate_output and converted_content.strip():
             try:
-                validator = ValidationEngine(box_ai_client=box_ai_client)
-                validation_results = validator.validate_conversion(
+                validation_results = validate_conversion(
+                    auth_config if use_ai else None,
+                    text_fingerprint(template_content),
+                    text_fingerprint(converted_content),
                     template_content,
-                    converted_content,
-                    {}
+                    converted_content
                 )
             except Exception as e:
                 st.warning(f"Validation failed: {str(e)}")
+                validation_failed = True
         
         # Store results in session state
-        st.session_state.converted_doc = output_path
+        st.session_state.converted_doc = output_bytes
+        st.session_state.converted_doc_name = output_name
         st.session_state.validation_results = validation_results
         
+        # Remember the result unless validation needs retrying
+        if not validation_failed and validation_results.get('validation_method') != AI_FALLBACK_METHOD:
+            session_results[result_key] = (output_bytes, validation_results)
+            if len(session_results) > SESSION_RESULT_CACHE_SIZE:
+                del session_results[next(iter(session_results))]
+        
     except Exception as e:
         st.error(f"Error during conversion: {str(e)}")
         st.exception(e)
         raise
 
 
-def preview_docx(uploaded_file) -> None:
-    """
-    Preview a DOCX file in Streamlit
-    
-    Args:
-        uploaded_file: Uploaded file object or file path
-    """
-    try:
-        if hasattr(uploaded_file, 'read'):
-            # Handle file upload object
-            doc = docx.Document(io.BytesIO(uploaded_file.getvalue()))
-        else:
-            # Handle file path
-            doc = docx.Document(uploaded_file)
-        
-        # Display paragraphs
-        for paragraph in doc.paragraphs:
-            if paragraph.text.strip():
-                st.write(paragraph.text)
-        
-        # Display tables
-        for i, table in enumerate(doc.tables):
-            st.write(f"**Table {i+1}:**")
-            
-            # Create a markdown table
-            table_data = []
-            for row in table.rows:
-                row_data = [cell.text for cell in row.cells]
-                table_data.append(row_data)
-            
-            if table_data:
-                # Create markdown table
-                md_table = "| " + " | ".join(table_data[0]) + " |\n"
-                md_table += "|" + "|".join(["---"] * len(table_data[0])) + "|\n"
-                
-                for row in table_data[1:]:
-                    md_table += "| " + " | ".join(row) + " |\n"
-                
-                st.markdown(md_table)
-    
-    except Exception as e:
-        st.error(f"Error previewing document: {str(e)}")
-
-
-def preview_docx_from_path(file_path: str) -> None:
-    """
-    Preview a DOCX file from a file path
-    
-    Args:
-        file_path: Path to the DOCX file
-    """
-    try:
-        preview_docx(file_path)
-    except Exception as e:
-        st.error(f"Error loading document: {str(e)}")
-
-
-if __name__ == "__main__":
-    main()
-
 def show_documentation():
     """Display documentation and examples for the template conversion."""
     st.write("## 📚 Documentation & Examples")
@@ -584,21 +687,19 @@ def show_conversion_results() -> None:
         show_validation_results(st.session_state.validation_results)
     
     # Show download button for the converted file
-    output_path = st.session_state.converted_doc
-    filename = os.path.basename(output_path)
+    output_bytes = st.session_state.converted_doc
     
-    with open(output_path, "rb") as file:
-        st.download_button(
-            label="⬇️ Download Converted Template",
-            data=file,
-            file_name=f"converted_{filename}",
-            mime="application/vnd.openxmlformats-officedocument.wordprocessingml.document",
-            key="download_converted"
-        )
+    st.download_button(
+        label="⬇️ Download Converted Template",
+        data=output_bytes,
+        file_name=st.session_state.get('converted_doc_name', 'converted_template.docx'),
+        mime="application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+        key="download_converted"
+    )
     
     # Show preview of the converted document
     st.subheader("🔍 Preview")
-    preview_docx_from_path(output_path)
+    preview_docx(output_bytes)
 
 
 def main() -> None:
@@ -611,12 +712,7 @@ def main() -> None:
     )
     
     # Initialize session state
-    if 'converted_doc' not in st.session_state:
-        st.session_state.converted_doc = None
-    if 'validation_results' not in st.session_state:
-        st.session_state.validation_results = {}
-    if 'box_ai_client' not in st.session_state:
-        st.session_state.box_ai_client = None
+    initialize_session_state()
     
     # Sidebar for authentication and settings
     with st.sidebar:
@@ -702,7 +798,7 @@ def main() -> None:
     
     if schema_file:
         try:
-            schema_data = json.load(schema_file)
+            schema_data = get_uploaded_schema(schema_file)
             st.success("Schema loaded successfully!")
         except Exception as e:
             st.error(f"Error loading schema: {str(e)}")
@@ -723,7 +819,7 @@ def main() -> None:
             with st.spinner("Converting template..."):
                 try:
                     process_conversion(
-                        template_file=template_file,
+                        uploaded_file=template_file,
                         query_text=query_text,
                         schema_data=schema_data,
                         use_ai=use_ai,
@@ -741,6 +837,77 @@ def main() -> None:
     # Show conversion results if available
     if hasattr(st.session_state, 'converted_doc') and st.session_state.converted_doc:
         show_conversion_results()
+    
+    # The page is rendered; load what the Convert action will need
+    warm_deferred_imports()
+
+
+def _developer_token_config(box_token: str) -> Dict[str, Any]:
+    """
+    Build an authentication configuration for a Box developer token
+    
+    Args:
+        box_token: Box API token
+        
+    Returns:
+        Authentication configuration for get_box_ai_client
+    """
+    return {
+        'developerToken': box_token,
+        'auth_method': _box_ai_client_module().AuthMethod.DEVELOPER_TOKEN
+    }
+
+
+def _token_auth_config(use_ai: bool, box_token: str) -> Optional[Dict[str, Any]]:
+    """
+    Get the authentication configuration for the file conversion functions
+    
+    Args:
+        use_ai: Whether to use Box AI for complex conversions
+        box_token: Box API token
+        
+    Returns:
+        Developer token configuration, or None for rule-based only
+    """
+    return _developer_token_config(box_token) if box_token and use_ai else None
+
+
+@functools.lru_cache(maxsize=CONVERSION_CACHE_SIZE)
+def _convert_file(
+    file_bytes: bytes,
+    converter: ConversionEngine
+) -> Tuple[bytes, str, str]:
+    """
+    Convert and export one template without touching Streamlit state
+    
+    Safe to run in a worker thread; the caller validates and records the
+    results. Results are cached on the file contents, so re-uploading an
+    unchanged template skips conversion and export.
+    
+    Args:
+        file_bytes: Contents of the uploaded file
+        converter: Shared conversion engine from get_conversion_components
+        
+    Returns:
+        Tuple of (converted DOCX bytes, original text, converted text)
+    """
+    return convert_docx_bytes(file_bytes, converter)
+
+
+def _record_conversion(file_name: str, converted_bytes: bytes,
+                       validation_results: Dict[str, Any]) -> None:
+    """
+    Store a converted file's results in session state
+    
+    Args:
+        file_name: Name of the uploaded file
+        converted_bytes: Contents of the converted DOCX file
+        validation_results: Validation results for the conversion
+    """
+    st.session_state.setdefault('converted_docs', {})[file_name] = {
+        'data': converted_bytes
+    }
+    st.session_state.setdefault('validation_results', {})[file_name] = validation_results
 
 
 def process_single_conversion(uploaded_file, use_ai: bool, box_token: str) -> None:
@@ -752,75 +919,121 @@ def process_single_conversion(uploaded_file, use_ai: bool, box_token: str) -> No
         use_ai: Whether to use Box AI for complex conversions
         box_token: Box API token
     """
-    # Create a temporary file
-    with tempfile.NamedTemporaryFile(delete=False, suffix='.docx') as tmp_file:
-        tmp_file.write(uploaded_file.getvalue())
-        tmp_path = tmp_file.name
-    
     try:
-        # Initialize components
-        parser = CongaTemplateParser(docx_file_path=tmp_path)
-        
-        # Initialize Box AI client if token is provided and AI is enabled
-        box_ai_client = None
-        if box_token and use_ai:
-            box_ai_client = BoxAIClient(box_token)
-        
-        # Parse the template
-        conga_tags = parser.parse()
-        doc = parser.get_document()
-        
-        # Convert the template
-        converter = ConversionEngine(box_ai_client=box_ai_client)
-        converted_doc = converter.convert_template(doc, conga_tags)
+        # Use Box AI if a token is provided and AI is enabled
+        auth_config = _token_auth_config(use_ai, box_token)
+        converter = get_conversion_components(auth_config)[0]
         
-        # Export the converted document
-        output_dir = tempfile.mkdtemp()
-        output_path = os.path.join(output_dir, f"converted_{uploaded_file.name}")
-        
-        exporter = DocxExporter()
-        exported_path = exporter.export_docx(converted_doc, output_path)
-        
-        # Validate the conversion
-        validator = ValidationEngine(box_ai_client=box_ai_client)
-        
-        # Extract text content for validation
-        original_content = "\n".join([p.text for p in doc.paragraphs])
-        converted_content = "\n".join([p.text for p in converted_doc.paragraphs])
-        
-        validation_results = validator.validate_conversion(
-            original_content, 
-            converted_content,
-            conga_tags
+        converted_bytes, original_content, converted_content = _convert_file(
+            uploaded_file.getvalue(), converter
         )
         
-        # Store results in session state
-        st.session_state.converted_docs[uploaded_file.name] = {
-            'doc': converted_doc,
-            'path': exported_path
-        }
-        
-        st.session_state.validation_results[uploaded_file.name] = validation_results
+        # Validate the conversion, reusing the result for an unchanged template
+        validation_results = validate_conversion(
+            auth_config,
+            text_fingerprint(original_content),
+            text_fingerprint(converted_content),
+            original_content,
+            converted_content
+        )
+        _record_conversion(uploaded_file.name, converted_bytes, validation_results)
         
         # Show success message
         st.success(f"Successfully converted {uploaded_file.name}")
         
         # Preview the converted document
         with st.expander("Preview Converted Template"):
-            preview_docx_from_path(exported_path)
+            preview_docx(converted_bytes)
             
     except Exception as e:
         st.error(f"Error converting {uploaded_file.name}: {str(e)}")
-    finally:
-        # Clean up temporary file
-        if os.path.exists(tmp_path):
-            os.unlink(tmp_path)
+
+
+def _build_zip(files: Dict[str, bytes]) -> bytes:
+    """
+    Pack converted files into an in-memory ZIP archive
+    
+    DOCX files are already deflated, so they are stored rather than recompressed.
+    
+    Args:
+        files: Contents of each converted file, by uploaded file name
+        
+    Returns:
+        Bytes of the ZIP archive
+    """
+    zip_buffer = io.BytesIO()
+    with zipfile.ZipFile(zip_buffer, 'w', zipfile.ZIP_STORED) as archive:
+        for file_name, data in files.items():
+            archive.writestr(f"converted_{os.path.basename(file_name)}", data)
+    return zip_buffer.getvalue()
+
+
+def _cached_batch_result(key: bytes) -> Optional[Tuple[bytes, str, str]]:
+    """
+    Get the batch conversion result for an earlier upload with the same contents
+    
+    Args:
+        key: blake2b digest of the uploaded file
+        
+    Returns:
+        Tuple of (converted DOCX bytes, original text, converted text), or None
+    """
+    with _BATCH_RESULTS_LOCK:
+        result = _BATCH_RESULTS.pop(key, None)
+        if result is not None:
+            # Re-insert so the entry becomes the most recently used
+            _BATCH_RESULTS[key] = result
+    return result
+
+
+def _cache_batch_result(key: bytes, result: Tuple[bytes, str, str]) -> None:
+    """
+    Keep a batch conversion result, evicting the least recently used one when full
+    
+    Args:
+        key: blake2b digest of the uploaded file
+        result: Tuple of (converted DOCX bytes, original text, converted text)
+    """
+    with _BATCH_RESULTS_LOCK:
+        if len(_BATCH_RESULTS) >= CONVERSION_CACHE_SIZE:
+            del _BATCH_RESULTS[next(iter(_BATCH_RESULTS))]
+        _BATCH_RESULTS[key] = result
+
+
+def _submit_conversions(pending: Dict[str, Tuple[bytes, bytes]]) -> Dict[Future, Tuple[str, bytes]]:
+    """
+    Submit uploads to the conversion pool, replacing the pool if an earlier worker crash broke it
+    
+    Parsing, converting and exporting are CPU-bound, so they run in worker
+    processes rather than threads that would contend for the GIL.
+    
+    Args:
+        pending: (cache key, file contents) of each upload to convert, by file name
+        
+    Returns:
+        Mapping of each submitted future to its (file name, cache key)
+    """
+    def submit_all(executor: ProcessPoolExecutor) -> Dict[Future, Tuple[str, bytes]]:
+        return {
+            executor.submit(convert_docx_bytes, file_bytes): (file_name, key)
+            for file_name, (key, file_bytes) in pending.items()
+        }
+    
+    try:
+        return submit_all(get_conversion_pool())
+    except BrokenProcessPool:
+        get_conversion_pool.clear()
+        return submit_all(get_conversion_pool())
 
 
 def process_batch_conversion(uploaded_files, use_ai: bool, box_token: str) -> None:
     """
     Process batch conversion of multiple files
     
+    Files are converted in parallel in the shared process pool, with progress
+    updated from this thread as each file completes; the conversions are then
+    validated together in one batch.
+    
     Args:
         uploaded_files: List of uploaded file objects
         use_ai: Whether to use Box AI for complex conversions
@@ -829,144 +1042,125 @@ def process_batch_conversion(uploaded_files, use_ai: bool, box_token: str) -> No
     progress_bar = st.progress(0)
     status_text = st.empty()
     
-    # Initialize Box AI client if token is provided and AI is enabled
-    box_ai_client = None
-    if box_token and use_ai:
-        box_ai_client = BoxAIClient(box_token)
+    # Use Box AI for validation if a token is provided and AI is enabled
+    validator = get_conversion_components(_token_auth_config(use_ai, box_token))[1]
+    
+    # Unchanged uploads reuse their earlier result; the rest go to the pool
+    converted = {}
+    pending = {}
+    for uploaded_file in uploaded_files:
+        file_bytes = uploaded_file.getvalue()
+        key = hashlib.blake2b(file_bytes, digest_size=16).digest()
+        result = _cached_batch_result(key)
+        if result is None:
+            pending[uploaded_file.name] = (key, file_bytes)
+        else:
+            converted[uploaded_file.name] = result
     
-    # Create output directory
-    output_dir = tempfile.mkdtemp()
+    futures = _submit_conversions(pending)
     
-    for i, uploaded_file in enumerate(uploaded_files):
-        progress = (i + 1) / len(uploaded_files)
-        progress_bar.progress(progress)
-        status_text.text(f"Processing {i+1}/{len(uploaded_files)}: {uploaded_file.name}")
+    pool_broken = False
+    last_update = 0.0
+    for done, future in enumerate(as_completed(futures), len(converted) + 1):
+        file_name, key = futures[future]
+        now = time.monotonic()
+        if now - last_update >= PROGRESS_UPDATE_INTERVAL or done == len(uploaded_files):
+            last_update = now
+            progress_bar.progress(done / len(uploaded_files))
+            status_text.text(f"Processed {done}/{len(uploaded_files)}: {file_name}")
         
         try:
-            # Create a temporary file
-            with tempfile.NamedTemporaryFile(delete=False, suffix='.docx') as tmp_file:
-                tmp_file.write(uploaded_file.getvalue())
-                tmp_path = tmp_file.name
-            
-            # Initialize components
-            parser = CongaTemplateParser(docx_file_path=tmp_path)
-            
-            # Parse the template
-            conga_tags = parser.parse()
-            doc = parser.get_document()
-            
-            # Convert the template
-            converter = ConversionEngine(box_ai_client=box_ai_client)
-            converted_doc = converter.convert_template(doc, conga_tags)
-            
-            # Export the converted document
-            output_path = os.path.join(output_dir, f"converted_{uploaded_file.name}")
-            
-            exporter = DocxExporter()
-            exported_path = exporter.export_docx(converted_doc, output_path)
-            
-            # Validate the conversion
-            validator = ValidationEngine(box_ai_client=box_ai_client)
-            
-            # Extract text content for validation
-            original_content = "\n".join([p.text for p in doc.paragraphs])
-            converted_content = "\n".join([p.text for p in converted_doc.paragraphs])
-            
-            validation_results = validator.validate_conversion(
-                original_content, 
-                converted_content,
-                conga_tags
-            )
-            
-            # Store results in session state
-            st.session_state.converted_docs[uploaded_file.name] = {
-                'doc': converted_doc,
-                'path': exported_path
-            }
-            
-            st.session_state.validation_results[uploaded_file.name] = validation_results
-            
+            converted[file_name] = future.result()
+        except BrokenProcessPool as e:
+            pool_broken = True
+            st.error(f"Error converting {file_name}: {str(e)}")
+            continue
         except Exception as e:
-            st.error(f"Error converting {uploaded_file.name}: {str(e)}")
-        finally:
-            # Clean up temporary file
-            if os.path.exists(tmp_path):
-                os.unlink(tmp_path)
+            st.error(f"Error converting {file_name}: {str(e)}")
+            continue
+        _cache_batch_result(key, converted[file_name])
+    
+    # A worker died; drop the pool so the next batch starts a fresh one
+    if pool_broken:
+        get_conversion_pool.clear()
+    
+    # Validate all conversions in one pass
+    status_text.text(f"Validating {len(converted)} converted files")
+    validations = validator.validate_batch(
+        [(original_content, converted_content) for _, original_content, converted_content in converted.values()]
+    )
+    for (file_name, (converted_bytes, _, _)), validation_results in zip(converted.items(), validations):
+        _record_conversion(file_name, converted_bytes, validation_results)
     
     # Complete the progress bar
     progress_bar.progress(1.0)
     status_text.text(f"Completed converting {len(uploaded_files)} files")
     
-    # Create a zip file of all converted documents
+    # Offer a zip file of all converted documents; it is only built when offered
     if len(uploaded_files) > 1:
-        import shutil
-        zip_path = os.path.join(tempfile.mkdtemp(), "converted_templates.zip")
-        shutil.make_archive(zip_path[:-4], 'zip', output_dir)
-        
-        with open(zip_path, "rb") as file:
-            st.download_button(
-                label="Download All Converted Templates (ZIP)",
-                data=file,
-                file_name="converted_templates.zip",
-                mime="application/zip"
-            )
+        st.download_button(
+            label="Download All Converted Templates (ZIP)",
+            data=_build_zip({file_name: result[0] for file_name, result in converted.items()}),
+            file_name="converted_templates.zip",
+            mime="application/zip"
+        )
 
 
-def preview_docx(uploaded_file) -> None:
+@st.cache_data(max_entries=32, show_spinner=False)
+def preview_content(docx_bytes: bytes) -> Tuple[List[str], List[List[List[str]]]]:
     """
-    Preview a DOCX file in Streamlit
+    Extract what the preview shows from a DOCX file, once per distinct content
     
     Args:
-        uploaded_file: Uploaded file object
-    """
-    try:
-        doc = docx.Document(io.BytesIO(uploaded_file.getvalue()))
-        
-        # Display paragraphs
-        for paragraph in doc.paragraphs:
-            if paragraph.text.strip():
-                st.write(paragraph.text)
+        docx_bytes: Bytes of the DOCX file
         
-        # Display tables
-        for i, table in enumerate(doc.tables):
-            st.write(f"Table {i+1}:")
-            table_data = []
-            
-            for row in table.rows:
-                row_data = [cell.text for cell in row.cells]
-                table_data.append(row_data)
-            
-            if table_data:
-                st.table(table_data)
+    Returns:
+        Tuple of (non-empty paragraph texts, cell texts of each table by row)
+    """
+    return docx_body_texts(docx_bytes)
+
+
+@st.cache_data(max_entries=32, show_spinner=False)
+def preview_file_content(path: str, mtime: float, size: int) -> Tuple[List[str], List[List[List[str]]]]:
+    """
+    Extract what the preview shows from a DOCX file on disk, once per file version
     
-    except Exception as e:
-        st.error(f"Error previewing document: {str(e)}")
+    Args:
+        path: Path to the DOCX file
+        mtime: Modification time of the file, so edits invalidate the entry
+        size: Size of the file in bytes
+        
+    Returns:
+        Tuple of (non-empty paragraph texts, cell texts of each table by row)
+    """
+    with open(path, 'rb') as f:
+        return preview_content(f.read())
 
 
-def preview_docx_from_path(file_path: str) -> None:
+def preview_docx(source: Union[str, bytes, io.BytesIO, Any]) -> None:
     """
-    Preview a DOCX file from a file path
+    Preview a DOCX file in Streamlit
     
     Args:
-        file_path: Path to the DOCX file
+        source: Path to the DOCX file, its bytes, a file-like object, or an
+            uploaded file object
     """
     try:
-        doc = docx.Document(file_path)
+        if isinstance(source, str):
+            # Key on the file's version so reruns don't even read it
+            file_stat = os.stat(source)
+            paragraphs, tables = preview_file_content(source, file_stat.st_mtime, file_stat.st_size)
+        else:
+            docx_bytes = source if isinstance(source, bytes) else source.getvalue()
+            paragraphs, tables = preview_content(docx_bytes)
         
-        # Display paragraphs
-        for paragraph in doc.paragraphs:
-            if paragraph.text.strip():
-                st.write(paragraph.text)
+        # Display paragraphs as one element rather than one per paragraph
+        if paragraphs:
+            st.markdown("\n\n".join(paragraphs))
         
         # Display tables
-        for i, table in enumerate(doc.tables):
+        for i, table_data in enumerate(tables):
             st.write(f"Table {i+1}:")
-            table_data = []
-            
-            for row in table.rows:
-                row_data = [cell.text for cell in row.cells]
-                table_data.append(row_data)
-            
             if table_data:
                 st.table(table_data)
     
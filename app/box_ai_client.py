@@ -1,11 +1,29 @@
 """
 Box AI API client for template conversion
 """
-import sys
+import asyncio
+import functools
+import hashlib
+import json
 import os
+import threading
 from typing import Dict, List, Any, Optional, Union, Tuple
 from boxsdk import Client
 from boxsdk.exception import BoxAPIException
+from boxsdk.network.default_network import DefaultNetwork
+from boxsdk.session.session import AuthorizedSession
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Prefer orjson for decoding Box API responses; fall back to the standard library
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:  # pragma: no cover
+    _loads = json.loads
+
+# Number of Box AI responses each client keeps for repeated identical requests
+RESPONSE_CACHE_SIZE = 256
 
 
 class BoxAIClientError(Exception):
@@ -17,6 +35,33 @@ class BoxAuthError(Exception):
     """Custom exception for Box authentication errors."""
     pass
 
+class _PooledNetwork(DefaultNetwork):
+    """boxsdk network layer with a sized connection pool and connection retries."""
+    
+    def __init__(self):
+        super().__init__()
+        adapter = HTTPAdapter(
+            pool_connections=10,
+            pool_maxsize=20,
+            max_retries=Retry(total=3, backoff_factor=0.2)
+        )
+        self._session.mount('https://', adapter)
+
+
+@functools.lru_cache(maxsize=1)
+def _shared_network() -> DefaultNetwork:
+    """
+    Get the process-wide network layer used by every BoxAIClient
+    
+    Sharing it keeps TCP/TLS connections to the Box API open across clients
+    instead of paying a new handshake for each one.
+    
+    Returns:
+        Pooled boxsdk network layer
+    """
+    return _PooledNetwork()
+
+
 class AuthMethod:
     """Authentication method enum."""
     JWT = 'jwt'
@@ -38,8 +83,67 @@ class BoxAIClient:
             config: Optional configuration dictionary or path to config file.
                    If None, will try to load from default location.
         """
+        # Set by developer-token authentication once the token has been checked
+        self.authenticated_user: Optional[Dict[str, str]] = None
         self.client = self._get_authenticated_client(config)
         self.base_url = "https://api.box.com/2.0"
+        # Raw bodies of responses to identical text-only AI requests, oldest first
+        self._response_cache: Dict[bytes, bytes] = {}
+        self._cache_lock = threading.Lock()
+    
+    @staticmethod
+    def _make_client(auth) -> Client:
+        """
+        Create a Box client that sends its requests through the shared connection pool
+        
+        Args:
+            auth: boxsdk OAuth2 (or subclass) instance
+            
+        Returns:
+            Box Client
+        """
+        return Client(auth, session=AuthorizedSession(auth, network_layer=_shared_network()))
+    
+    def _post_ai(self, endpoint: str, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Send a Box AI request, reusing the response to an identical earlier request
+        
+        Requests that reference a Box file are always sent, since the file may
+        have changed since the last call.
+        
+        Args:
+            endpoint: Box AI endpoint URL
+            payload: Request body
+            
+        Returns:
+            Decoded JSON response
+        """
+        cacheable = not any(item.get('id') != 'temp' for item in payload.get('items', ()))
+        if cacheable:
+            key = hashlib.blake2b(
+                (endpoint + '\0' + json.dumps(payload, sort_keys=True)).encode('utf-8'),
+                digest_size=16
+            ).digest()
+            with self._cache_lock:
+                cached = self._response_cache.get(key)
+            if cached is not None:
+                # Decode per call so callers never share (and mutate) one response dict
+                return _loads(cached)
+        
+        response = self.client.make_request(
+            'POST',
+            endpoint,
+            data=payload
+        )
+        content = response.content
+        result = _loads(content)
+        
+        if cacheable:
+            with self._cache_lock:
+                if len(self._response_cache) >= RESPONSE_CACHE_SIZE:
+                    del self._response_cache[next(iter(self._response_cache))]
+                self._response_cache[key] = content
+        return result
     
     def _get_authenticated_client(self, config: Optional[Dict[str, Any]] = None) -> Client:
         """
@@ -51,7 +155,7 @@ class BoxAIClient:
         Returns:
             Authenticated Box Client
         """
-        from boxsdk import OAuth2, Client
+        from boxsdk import OAuth2
         
         if not config:
             raise BoxAuthError("No authentication configuration provided")
@@ -62,7 +166,7 @@ class BoxAIClient:
             from boxsdk import JWTAuth
             try:
                 auth = JWTAuth.from_settings_dictionary(config)
-                return Client(auth)
+                return self._make_client(auth)
             except Exception as e:
                 raise BoxAuthError(f"JWT authentication failed: {str(e)}")
             
@@ -76,7 +180,7 @@ class BoxAIClient:
                 if auth_method == AuthMethod.OAUTH2_CCG:
                     # For Client Credentials Grant
                     access_token, _ = oauth.authenticate_instance()
-                    return Client(oauth)
+                    return self._make_client(oauth)
                 else:
                     # For Authorization Code Grant
                     auth_url, _ = oauth.get_authorization_url('http://localhost')
@@ -84,7 +188,7 @@ class BoxAIClient:
                     auth_code = st.text_input('Enter the authorization code:')
                     if auth_code:
                         access_token, refresh_token = oauth.authenticate(auth_code)
-                        return Client(oauth)
+                        return self._make_client(oauth)
                     raise BoxAuthError("Authorization code is required")
             except Exception as e:
                 raise BoxAuthError(f"OAuth 2.0 authentication failed: {str(e)}")
@@ -108,19 +212,17 @@ class BoxAIClient:
                 )
                 
                 # Test the token by making a simple API call
-                client = Client(oauth)
+                client = self._make_client(oauth)
                 try:
                     # Test the token by getting current user info
                     user = client.user(user_id='me').get()
                     
-                    # Store user info in session state if available
-                    if 'streamlit' in sys.modules:
-                        import streamlit as st
-                        st.session_state.authenticated_user = {
-                            'name': user.name,
-                            'login': user.login,
-                            'status': 'active'
-                        }
+                    # Keep the user info on the client; callers decide where to surface it
+                    self.authenticated_user = {
+                        'name': user.name,
+                        'login': user.login,
+                        'status': 'active'
+                    }
                     
                     return client
                     
@@ -167,12 +269,7 @@ class BoxAIClient:
         elif content:
             payload["items"] = [{"id": "temp", "type": "file", "content": content}]
         
-        response = self.client.make_request(
-            'POST',
-            endpoint,
-            data=payload
-        )
-        return response.json()
+        return self._post_ai(endpoint, payload)
         
     def generate_text(self, prompt: str, content: Optional[str] = None, 
                      file_id: Optional[str] = None,
@@ -209,12 +306,7 @@ class BoxAIClient:
         elif content:
             payload["items"] = [{"id": "temp", "type": "file", "content": content}]
         
-        response = self.client.make_request(
-            'POST',
-            endpoint,
-            data=payload
-        )
-        return response.json()
+        return self._post_ai(endpoint, payload)
         
     def extract_structured_metadata(self, content: str, 
                                    fields: List[Dict[str, str]]) -> Dict[str, Any]:
@@ -243,7 +335,7 @@ class BoxAIClient:
             endpoint,
             data=payload
         )
-        return response.json()
+        return _loads(response.content)
     
     def get_file_content(self, file_id: str) -> str:
         """
@@ -278,3 +370,79 @@ class BoxAIClient:
         folder = self.client.folder(folder_id)
         file_obj = folder.upload(file_path)
         return file_obj.response_object
+
+
+class AsyncBoxAIClient:
+    """
+    Asyncio facade over BoxAIClient for issuing many Box AI requests concurrently
+
+    boxsdk is synchronous, so each request runs in a worker thread while a
+    semaphore caps how many are in flight against the Box AI rate limit.
+    """
+    
+    def __init__(self, client: BoxAIClient, max_concurrency: int = 8):
+        """
+        Initialize the async client
+        
+        Args:
+            client: Authenticated BoxAIClient used to send the requests
+            max_concurrency: Maximum number of requests in flight at once (default: 8)
+        """
+        self.client = client
+        self.max_concurrency = max_concurrency
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+    
+    def _limiter(self) -> asyncio.Semaphore:
+        """
+        Get the semaphore for the running event loop, creating it on first use
+        
+        Returns:
+            Semaphore bounding concurrent requests
+        """
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._loop = loop
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        return self._semaphore
+    
+    async def ask_ai(self, prompt: str, content: Optional[str] = None, 
+                     file_id: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Ask Box AI a question without blocking the event loop
+        
+        See BoxAIClient.ask_ai for the arguments and return value.
+        """
+        async with self._limiter():
+            return await asyncio.to_thread(self.client.ask_ai, prompt, content, file_id)
+    
+    async def generate_text(self, prompt: str, content: Optional[str] = None, 
+                            file_id: Optional[str] = None,
+                            system_prompt: Optional[str] = None,
+                            max_tokens: int = 2048) -> Dict[str, Any]:
+        """
+        Generate text using Box AI without blocking the event loop
+        
+        See BoxAIClient.generate_text for the arguments and return value.
+        """
+        async with self._limiter():
+            return await asyncio.to_thread(
+                self.client.generate_text,
+                prompt,
+                content,
+                file_id,
+                system_prompt,
+                max_tokens
+            )
+    
+    async def generate_text_many(self, requests: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Run several text generation requests concurrently
+        
+        Args:
+            requests: List of keyword-argument dicts for generate_text
+            
+        Returns:
+            List of responses in the same order as the requests
+        """
+        return await asyncio.gather(*(self.generate_text(**request) for request in requests))
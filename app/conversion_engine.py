@@ -2,10 +2,13 @@
 Conversion engine for transforming Conga templates to Box DocGen format.
 """
 from __future__ import annotations
-from typing import Dict, List, Optional, Any, Type, TypeVar, TYPE_CHECKING
+import asyncio
+import io
+import re
+from typing import Dict, List, Optional, Any, Tuple, Type, TypeVar, TYPE_CHECKING
 
-from boxsdk import Client
 from docx import Document
+from docx.text.run import Run
 
 # Define a type variable for BoxAIClient
 BoxAIClientType = TypeVar('BoxAIClientType', bound=Any)
@@ -18,6 +21,18 @@ def get_box_ai_client() -> BoxAIClientClass:
     from app.box_ai_client import BoxAIClient
     return BoxAIClient
 
+# Token budget for converting a whole template with Box AI
+AI_MAX_TOKENS = 4000
+
+# Conga merge-field markers and their Handlebars replacements, matched in a single pass
+_MERGE_MARKERS = {
+    '&=': '{{',
+    '&!': '{{',
+    '&+': '{{',
+    '&': '}}'
+}
+_MERGE_MARKER_PATTERN = re.compile(r'&[=!+]?')
+
 
 class ConversionEngine:
     """Engine for converting Conga templates to Box DocGen format."""
@@ -46,13 +61,9 @@ class ConversionEngine:
         """
         # Simple rule-based conversion for common patterns
         # This can be extended with more sophisticated rules
-        converted = text
         
-        # Convert simple merge fields
-        converted = converted.replace('&=', '{{')
-        converted = converted.replace('&!', '{{')
-        converted = converted.replace('&+', '{{')
-        converted = converted.replace('&', '}}')
+        # Convert simple merge fields in one scan instead of one per marker
+        converted = _MERGE_MARKER_PATTERN.sub(lambda match: _MERGE_MARKERS[match.group()], text)
         
         # Convert IF conditions
         converted = self._convert_conditions(converted)
@@ -141,60 +152,159 @@ class ConversionEngine:
         
         return '\n'.join(converted_lines)
     
+    def run_batch(self, templates: List[str], max_concurrency: int = 8) -> List[str]:
+        """Convert several template texts.
+        
+        Uses Box AI when a client is configured, with the requests sent
+        concurrently instead of one after another; otherwise the rule-based
+        conversion in convert_text.
+        
+        Args:
+            templates: Template texts with Conga merge fields
+            max_concurrency: Maximum number of Box AI requests in flight at once
+            
+        Returns:
+            List[str]: Converted texts in the same order as the input
+        """
+        if self.box_ai_client is None:
+            return [self.convert_text(text) for text in templates]
+        
+        return asyncio.run(self.run_batch_async(templates, max_concurrency))
+    
+    async def run_batch_async(self, templates: List[str], max_concurrency: int = 8) -> List[str]:
+        """Convert several template texts with concurrent Box AI requests.
+        
+        Args:
+            templates: Template texts with Conga merge fields
+            max_concurrency: Maximum number of Box AI requests in flight at once
+            
+        Returns:
+            List[str]: Converted texts in the same order as the input
+        """
+        if self.box_ai_client is None:
+            return self.run_batch(templates)
+        
+        from app.box_ai_client import AsyncBoxAIClient
+        client = AsyncBoxAIClient(self.box_ai_client, max_concurrency=max_concurrency)
+        responses = await client.generate_text_many([self._ai_request(text) for text in templates])
+        return [self._parse_ai_response(response) for response in responses]
+    
+    def _ai_request(self, template_text: str) -> Dict[str, Any]:
+        """Build the generate_text arguments for converting a template with Box AI.
+        
+        Args:
+            template_text: Template text to convert
+            
+        Returns:
+            Dict: Keyword arguments for BoxAIClient.generate_text
+        """
+        from app.prompt_builder import PromptBuilder, ConversionContext
+        
+        prompt = PromptBuilder(ConversionContext(template_text=template_text)).build_conversion_prompt()
+        return {
+            'prompt': prompt['user_prompt'],
+            'system_prompt': prompt['system_prompt'],
+            'max_tokens': AI_MAX_TOKENS
+        }
+    
+    def _parse_ai_response(self, response: Dict[str, Any]) -> str:
+        """Extract the converted template from a Box AI text generation response.
+        
+        Args:
+            response: JSON response returned by BoxAIClient.generate_text
+            
+        Returns:
+            str: Converted template text
+        """
+        from app.response_parser import AIResponseParser
+        
+        return AIResponseParser.parse_conversion_result(response.get('answer', ''))['content']
+    
     def convert_document(self, doc: Document) -> Document:
         """Convert a Word document with Conga templates to Box DocGen format.
         
+        The input is copied once and its paragraphs are rewritten in place, so
+        body elements, styles and document properties are kept as they are
+        instead of being rebuilt element by element.
+        
         Args:
             doc: Input Word document
             
         Returns:
             Document: Converted Word document
         """
-        # Create a new document for the output
-        new_doc = Document()
+        # Copy through a save and reload; copy.deepcopy would give the copy a
+        # body proxy detached from the element tree that is saved
+        buffer = io.BytesIO()
+        doc.save(buffer)
+        buffer.seek(0)
+        new_doc = Document(buffer)
         
-        # Copy document properties
-        new_doc.core_properties = doc.core_properties
+        self.convert_paragraphs(new_doc)
+        return new_doc
+    
+    def convert_paragraphs(self, doc: Document) -> None:
+        """Convert the body and table paragraphs of a Word document in place.
         
-        # Process each paragraph
+        Args:
+            doc: Word document to convert
+        """
+        # Process body paragraphs
         for para in doc.paragraphs:
-            converted_text = self.convert_text(para.text)
-            new_para = new_doc.add_paragraph(converted_text)
-            
-            # Copy paragraph formatting
-            new_para.style = para.style
-            
-            # Copy runs and formatting
-            for run in para.runs:
-                new_run = new_para.add_run(run.text)
-                new_run.bold = run.bold
-                new_run.italic = run.italic
-                new_run.underline = run.underline
-                new_run.font.name = run.font.name
-                new_run.font.size = run.font.size
-                new_run.font.color.rgb = run.font.color.rgb if run.font.color.rgb else None
-        
-        # Process tables
+            self._convert_paragraph(para)
+        
+        # Process paragraphs inside tables
         for table in doc.tables:
-            new_table = new_doc.add_table(rows=len(table.rows), cols=len(table.columns))
-            
-            for i, row in enumerate(table.rows):
-                for j, cell in enumerate(row.cells):
-                    converted_text = self.convert_text(cell.text)
-                    new_table.cell(i, j).text = converted_text
-                    
-                    # Copy cell formatting
-                    # Note: This is a simplified example - you might want to copy more formatting
-                    new_table.cell(i, j).width = cell.width
-                    
-                    # Copy paragraph formatting in the cell
+            for row in table.rows:
+                for cell in row.cells:
                     for para in cell.paragraphs:
-                        new_para = new_table.cell(i, j).add_paragraph()
-                        new_para.style = para.style
-                        
-                        for run in para.runs:
-                            new_run = new_para.add_run(run.text)
-                            new_run.bold = run.bold
-                            new_run.italic = run.italic
+                        self._convert_paragraph(para)
+    
+    def _convert_paragraph(self, para: Any) -> None:
+        """Replace a paragraph's text with its converted form, in place.
         
-        return new_doc
+        The converted text goes into the first run so its formatting is kept;
+        the remaining runs, including those inside hyperlinks, are emptied
+        because Conga tags often span runs.
+        
+        Args:
+            para: python-docx Paragraph to convert
+        """
+        # Paragraph.runs leaves out hyperlink runs, but Paragraph.text includes them
+        runs = [Run(r, para) for r in para._p.xpath('./w:r | ./w:hyperlink/w:r')]
+        if not runs:
+            return
+        
+        original = "".join(run.text for run in runs)
+        converted = self.convert_text(original)
+        if converted == original:
+            return
+        
+        runs[0].text = converted
+        for run in runs[1:]:
+            run.text = ""
+
+
+def convert_docx_bytes(file_bytes: bytes, engine: Optional[ConversionEngine] = None) -> Tuple[bytes, str, str]:
+    """Convert and export one DOCX template, entirely in memory.
+    
+    The document is opened from the bytes and converted in place, so no copy
+    is needed. Document conversion is rule-based and needs no Box AI client,
+    and the arguments and results are plain bytes and strings, so this can run
+    in a worker process.
+    
+    Args:
+        file_bytes: Contents of the template DOCX file
+        engine: Conversion engine to use; a rule-based one is created if omitted
+        
+    Returns:
+        Tuple: (converted DOCX bytes, original body text, converted body text)
+    """
+    from app.docx_text import doc_to_text
+    from app.exporter import DocxExporter
+    
+    doc = Document(io.BytesIO(file_bytes))
+    original_text = doc_to_text(doc)
+    (engine or ConversionEngine()).convert_paragraphs(doc)
+    
+    return DocxExporter().export_to_bytes(doc), original_text, doc_to_text(doc)
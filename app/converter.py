@@ -1,16 +1,20 @@
 """
 Conversion engine for transforming Conga templates to Box DocGen templates
 """
+import asyncio
 import re
 from typing import Dict, List, Any, Optional, Tuple
 import docx
 
 try:
     # For production
-    from .box_ai_client import BoxAIClient
+    from .box_ai_client import BoxAIClient, AsyncBoxAIClient
 except ImportError:
     # For development
-    from box_ai_client import BoxAIClient
+    from box_ai_client import BoxAIClient, AsyncBoxAIClient
+
+# Upper bound on concurrent Box AI requests for tags the rules cannot convert
+AI_MAX_CONCURRENCY = 8
 
 
 class ConversionEngine:
@@ -82,7 +86,8 @@ class ConversionEngine:
         Returns:
             docx.Document with converted Box DocGen tags
         """
-        # Process each tag by type
+        # Process each tag by type, collecting the ones the rules cannot convert
+        ai_tags = []
         for tag in conga_tags:
             if tag['location'] is None:
                 continue
@@ -90,6 +95,14 @@ class ConversionEngine:
             converted_tag = self._convert_tag(tag)
             if converted_tag:
                 self._replace_tag_in_document(doc, tag, converted_tag)
+            elif self.box_ai_client:
+                ai_tags.append(tag)
+        
+        # Convert the remaining tags with Box AI, all requests in flight together
+        if ai_tags:
+            for tag, converted_tag in zip(ai_tags, self._ai_assisted_conversions(ai_tags)):
+                if converted_tag:
+                    self._replace_tag_in_document(doc, tag, converted_tag)
         
         return doc
     
@@ -117,10 +130,7 @@ class ConversionEngine:
         elif tag_type == 'table_end':
             return self._convert_table_end(full_match)
         
-        # If no direct conversion is possible, try AI-assisted conversion
-        if self.box_ai_client:
-            return self._ai_assisted_conversion(tag)
-            
+        # No direct conversion; convert_template falls back to Box AI
         return None
     
     def _convert_merge_field(self, tag_text: str) -> str:
@@ -234,20 +244,7 @@ class ConversionEngine:
             
             return f"{{{{#lt {field} {value}}}}}{true_value}{{{{else}}}}{false_value}{{{{/lt}}}}"
         
-        # If no direct pattern match, try AI-assisted conversion
-        if self.box_ai_client:
-            prompt = f"""
-            Convert this Conga template conditional tag to Box DocGen format:
-            
-            {tag_text}
-            
-            Return only the Box DocGen equivalent without explanation.
-            """
-            
-            response = self.box_ai_client.generate_text(prompt)
-            if 'answer' in response:
-                return response['answer'].strip()
-                
+        # No direct pattern match; convert_template falls back to Box AI
         return None
     
     def _convert_table_start(self, tag_text: str) -> str:
@@ -290,20 +287,54 @@ class ConversionEngine:
         
         return re.sub(pattern, replacement, tag_text)
     
-    def _ai_assisted_conversion(self, tag: Dict[str, Any]) -> Optional[str]:
+    def _ai_assisted_conversions(self, tags: List[Dict[str, Any]]) -> List[Optional[str]]:
         """
-        Use Box AI for complex conversion scenarios
+        Use Box AI for tags the mapping rules could not convert
+        
+        The requests run concurrently, at most AI_MAX_CONCURRENCY at a time, and
+        a tag that occurs several times is only sent once.
+        Must not be called from a running event loop.
+        
+        Args:
+            tags: List of tag dictionaries to convert
+            
+        Returns:
+            AI-generated conversions, None where no answer was returned, in tag order
+        """
+        prompts = [self._ai_prompt(tag) for tag in tags]
+        unique_prompts = list(dict.fromkeys(prompts))
+        
+        client = AsyncBoxAIClient(self.box_ai_client, max_concurrency=AI_MAX_CONCURRENCY)
+        responses = asyncio.run(client.generate_text_many(
+            [{'prompt': prompt} for prompt in unique_prompts]
+        ))
+        
+        answers = {
+            prompt: response['answer'].strip() if 'answer' in response else None
+            for prompt, response in zip(unique_prompts, responses)
+        }
+        return [answers[prompt] for prompt in prompts]
+    
+    def _ai_prompt(self, tag: Dict[str, Any]) -> str:
+        """
+        Build the Box AI prompt for converting a single tag
         
         Args:
             tag: Dictionary containing tag information
             
         Returns:
-            AI-generated conversion or None if not available
+            Prompt text
         """
-        if not self.box_ai_client:
-            return None
+        if tag['type'] == 'conditional':
+            return f"""
+            Convert this Conga template conditional tag to Box DocGen format:
             
-        prompt = f"""
+            {tag['full_match']}
+            
+            Return only the Box DocGen equivalent without explanation.
+            """
+        
+        return f"""
         Convert this Conga template tag to Box DocGen format:
         
         Conga tag: {tag['full_match']}
@@ -311,12 +342,6 @@ class ConversionEngine:
         
         Return only the Box DocGen equivalent without explanation.
         """
-        
-        response = self.box_ai_client.generate_text(prompt)
-        if 'answer' in response:
-            return response['answer'].strip()
-            
-        return None
     
     def _replace_tag_in_document(self, doc: docx.Document, tag: Dict[str, Any], 
                                 converted_tag: str) -> None:
@@ -0,0 +1,193 @@
+"""
+Fast paragraph text extraction for DOCX documents
+"""
+import io
+import zipfile
+from typing import Any, Dict, List, Tuple
+
+from docx.oxml.ns import nsmap, qn
+from lxml import etree
+
+# Body paragraphs plus the run content python-docx's Paragraph.text reads, in
+# document order; evaluated in one libxml2 pass instead of per paragraph and run
+_RUN_CONTENT = '*[self::w:t or self::w:tab or self::w:br or self::w:cr or self::w:noBreakHyphen or self::w:ptab]'
+_PARAGRAPH_CONTENT = etree.XPath(
+    f'./w:p | ./w:p/w:r/{_RUN_CONTENT} | ./w:p/w:hyperlink/w:r/{_RUN_CONTENT}',
+    namespaces={'w': nsmap['w']}
+)
+_W_P = qn('w:p')
+_W_T = qn('w:t')
+_W_BR = qn('w:br')
+_W_BR_TYPE = qn('w:type')
+_W_TBL = qn('w:tbl')
+_W_TR = qn('w:tr')
+_W_TC = qn('w:tc')
+_W_VAL = qn('w:val')
+_GRID_BEFORE = etree.XPath('w:trPr/w:gridBefore/@w:val', namespaces={'w': nsmap['w']})
+_GRID_SPAN = etree.XPath('w:tcPr/w:gridSpan/@w:val', namespaces={'w': nsmap['w']})
+_V_MERGE = etree.XPath('w:tcPr/w:vMerge', namespaces={'w': nsmap['w']})
+
+# Text python-docx gives the remaining run content elements
+_RUN_CONTENT_TEXT = {
+    qn('w:tab'): '\t',
+    qn('w:ptab'): '\t',
+    qn('w:cr'): '\n',
+    qn('w:noBreakHyphen'): '-'
+}
+
+# Parser for reading document XML straight from a DOCX file; like python-docx's
+# own parser it does not expand entities
+_XML_PARSER = etree.XMLParser(remove_blank_text=True, resolve_entities=False)
+_OFFICE_DOCUMENT_REL = 'http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument'
+
+def _body_paragraph_texts(body: Any) -> List[str]:
+    """
+    Get the text of the paragraphs directly in a w:body element
+    
+    Args:
+        body: w:body lxml element, from python-docx or parsed directly
+        
+    Returns:
+        List of paragraph texts in document order, as Paragraph.text would give them
+    """
+    paragraphs = []
+    for element in _PARAGRAPH_CONTENT(body):
+        tag = element.tag
+        if tag == _W_P:
+            parts = []
+            paragraphs.append(parts)
+        elif tag == _W_T:
+            parts.append(element.text or '')
+        elif tag == _W_BR:
+            # Line breaks read as newlines; page and column breaks as nothing
+            parts.append('\n' if element.get(_W_BR_TYPE, 'textWrapping') == 'textWrapping' else '')
+        else:
+            parts.append(_RUN_CONTENT_TEXT[tag])
+    return ["".join(parts) for parts in paragraphs]
+
+def _without_blank(texts: List[str]) -> List[str]:
+    """
+    Drop empty and whitespace-only texts
+    
+    Args:
+        texts: Paragraph texts
+        
+    Returns:
+        The texts with content
+    """
+    # isspace() tests without allocating a stripped copy of each paragraph
+    return [text for text in texts if text and not text.isspace()]
+
+def paragraph_texts(doc: Any, skip_blank: bool = False) -> List[str]:
+    """
+    Get the text of a document's body paragraphs, as Paragraph.text would give it
+    
+    Args:
+        doc: python-docx Document
+        skip_blank: Whether to leave out empty and whitespace-only paragraphs
+        
+    Returns:
+        List of paragraph texts in document order
+    """
+    texts = _body_paragraph_texts(doc.element.body)
+    return _without_blank(texts) if skip_blank else texts
+
+def _table_texts(body: Any) -> List[List[List[str]]]:
+    """
+    Get the cell text of each table directly in a w:body element
+    
+    Args:
+        body: w:body lxml element, from python-docx or parsed directly
+        
+    Returns:
+        Cell texts of each table by row, as Table.rows and Row.cells would give them
+    """
+    tables = []
+    for tbl in body.iterchildren(_W_TBL):
+        rows = []
+        # Text of the cell covering each layout-grid column in the previous row
+        above: Dict[int, str] = {}
+        for tr in tbl.iterchildren(_W_TR):
+            row = []
+            covering = {}
+            grid_before = _GRID_BEFORE(tr)
+            column = int(grid_before[0]) if grid_before else 0
+            for tc in tr.iterchildren(_W_TC):
+                grid_span = _GRID_SPAN(tc)
+                span = int(grid_span[0]) if grid_span else 1
+                v_merge = _V_MERGE(tc)
+                for offset in range(column, column + span):
+                    if v_merge and v_merge[0].get(_W_VAL, 'continue') == 'continue':
+                        # Later rows of a vertical merge read as the merge's first cell
+                        text = above.get(offset, '')
+                    else:
+                        text = "\n".join(_body_paragraph_texts(tc))
+                    covering[offset] = text
+                    row.append(text)
+                column += span
+            rows.append(row)
+            above = covering
+        tables.append(rows)
+    return tables
+
+def _docx_body(docx_bytes: bytes) -> Any:
+    """
+    Parse the w:body element of a DOCX file's main document part
+    
+    Args:
+        docx_bytes: Bytes of the DOCX file
+        
+    Returns:
+        w:body lxml element
+    """
+    with zipfile.ZipFile(io.BytesIO(docx_bytes)) as archive:
+        package_rels = etree.fromstring(archive.read('_rels/.rels'), _XML_PARSER)
+        target = next(
+            rel.get('Target') for rel in package_rels
+            if rel.get('Type') == _OFFICE_DOCUMENT_REL
+        )
+        root = etree.fromstring(archive.read(target.lstrip('/')), _XML_PARSER)
+    return root.find(qn('w:body'))
+
+def docx_paragraph_texts(docx_bytes: bytes, skip_blank: bool = False) -> List[str]:
+    """
+    Get the body paragraph text of a DOCX file without building a python-docx Document
+    
+    Only the main document part is read and parsed, which is much cheaper than
+    loading the whole package when nothing but the text is needed.
+    
+    Args:
+        docx_bytes: Bytes of the DOCX file
+        skip_blank: Whether to leave out empty and whitespace-only paragraphs
+        
+    Returns:
+        List of paragraph texts in document order
+    """
+    texts = _body_paragraph_texts(_docx_body(docx_bytes))
+    return _without_blank(texts) if skip_blank else texts
+
+def docx_body_texts(docx_bytes: bytes) -> Tuple[List[str], List[List[List[str]]]]:
+    """
+    Get the body paragraph and table text of a DOCX file without building a python-docx Document
+    
+    Args:
+        docx_bytes: Bytes of the DOCX file
+        
+    Returns:
+        Tuple of (non-empty paragraph texts, cell texts of each table by row)
+    """
+    body = _docx_body(docx_bytes)
+    return _without_blank(_body_paragraph_texts(body)), _table_texts(body)
+
+def doc_to_text(doc: Any, skip_blank: bool = False) -> str:
+    """
+    Join a document's body paragraph text
+    
+    Args:
+        doc: python-docx Document
+        skip_blank: Whether to leave out whitespace-only paragraphs
+        
+    Returns:
+        Paragraph text joined with newlines
+    """
+    return "\n".join(paragraph_texts(doc, skip_blank=skip_blank))
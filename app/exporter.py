@@ -1,10 +1,15 @@
 """
 DOCX export utility for preserving formatting and Box tags
 """
+import io
 import os
 import docx
 from typing import Dict, List, Any, Optional
 
+# Buffer size for writing exported files; DOCX output is written in many small
+# zip chunks, which the default buffer turns into thousands of write() calls
+_WRITE_BUF = 128 * 1024
+
 
 class DocxExporter:
     """
@@ -31,11 +36,32 @@ class DocxExporter:
         # Ensure directory exists
         os.makedirs(os.path.dirname(output_path), exist_ok=True)
         
-        # Save the document
-        doc.save(output_path)
+        return self._save(doc, output_path)
+    
+    @staticmethod
+    def _save(doc: docx.Document, output_path: str) -> str:
+        """
+        Save a document through a large write buffer, into an existing directory
+        """
+        with open(output_path, 'wb', buffering=_WRITE_BUF) as f:
+            doc.save(f)
         
         return output_path
     
+    def export_to_bytes(self, doc: docx.Document) -> bytes:
+        """
+        Export document to DOCX format in memory
+        
+        Args:
+            doc: docx.Document object to export
+            
+        Returns:
+            Contents of the DOCX file
+        """
+        buffer = io.BytesIO()
+        doc.save(buffer)
+        return buffer.getvalue()
+    
     def batch_export(self, docs: Dict[str, docx.Document], output_dir: str) -> Dict[str, str]:
         """
         Export multiple documents to DOCX format
@@ -57,8 +83,7 @@ class DocxExporter:
             base_name = os.path.basename(filename)
             output_path = os.path.join(output_dir, f"converted_{base_name}")
             
-            # Export the document
-            exported_path = self.export_docx(doc, output_path)
-            exported_files[filename] = exported_path
+            # Export the document; the directory was created above
+            exported_files[filename] = self._save(doc, output_path)
             
         return exported_files
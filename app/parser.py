@@ -1,10 +1,41 @@
 """
 Parser module for extracting Conga tags from DOCX files
 """
+import copy
+import functools
+import io
+import os
 import re
 import docx
 from typing import Dict, List, Tuple, Any, Optional
 
+# Substrings that mark a run as possibly containing a Conga tag
+_TAG_MARKERS = ('&=', '{{', '}}', '{IF', '{TABLE', '{END')
+
+# Compiled patterns for the different Conga tag types
+_TAG_PATTERNS = {
+    'merge_field': re.compile(r'&=([A-Za-z0-9._]+)'),
+    'curly_brace_field': re.compile(r'\{\{([^}]+)\}\}'),
+    'conditional': re.compile(r'\{IF\s+"([^"]+)"\s+([^}]+)\}'),
+    'table_start': re.compile(r'\{TABLE\s+([^}]+)\}'),
+    'table_end': re.compile(r'\{END\s+([^}]+)\}')
+}
+
+
+@functools.lru_cache(maxsize=64)
+def _parsed_template(path: str, mtime: float) -> docx.Document:
+    """
+    Parse a DOCX file once per (path, modification time)
+
+    Args:
+        path: Path to the DOCX file
+        mtime: Modification time of the file, so edits invalidate the entry
+
+    Returns:
+        Shared docx.Document; callers must copy it before modifying
+    """
+    return docx.Document(path)
+
 
 class CongaTemplateParser:
     """
@@ -18,12 +49,13 @@ class CongaTemplateParser:
         
         Args:
             docx_file_path: Path to the DOCX file
-            docx_file_obj: File object (used when uploading via Streamlit)
+            docx_file_obj: File object or raw DOCX bytes (used when uploading via Streamlit)
         """
         self.docx_file_path = docx_file_path
         self.docx_file_obj = docx_file_obj
         self.doc = None
         self.text_content = ""
+        self.paragraph_text = ""  # Body paragraphs only, without table text
         self.tags = []
         self.tag_locations = []  # Store paragraph/run locations for replacement
         
@@ -35,9 +67,13 @@ class CongaTemplateParser:
             List of dictionaries containing tag information
         """
         if self.docx_file_path:
-            self.doc = docx.Document(self.docx_file_path)
+            cached = _parsed_template(self.docx_file_path, os.path.getmtime(self.docx_file_path))
+            self.doc = copy.deepcopy(cached)
         else:
-            self.doc = docx.Document(self.docx_file_obj)
+            file_obj = self.docx_file_obj
+            if isinstance(file_obj, (bytes, bytearray)):
+                file_obj = io.BytesIO(file_obj)
+            self.doc = docx.Document(file_obj)
             
         self._extract_text_and_locations()
         self._identify_tags()
@@ -64,15 +100,19 @@ class CongaTemplateParser:
             
             # Track tag locations in paragraphs
             for j, run in enumerate(paragraph.runs):
-                if any(pattern in run.text for pattern in ['&=', '{{', '}}', '{IF', '{TABLE', '{END']):
+                run_text = run.text  # each .text access walks the run's XML
+                if any(pattern in run_text for pattern in _TAG_MARKERS):
                     self.tag_locations.append({
                         'type': 'paragraph',
                         'paragraph_index': i,
                         'run_index': j,
-                        'text': run.text,
+                        'text': run_text,
                         'original_run': run  # Store reference to the original run
                     })
         
+        # Keep the body text on its own so callers need not walk the paragraphs again
+        self.paragraph_text = "\n".join(full_text)
+        
         # Process tables
         for table_idx, table in enumerate(self.doc.tables):
             for row_idx, row in enumerate(table.rows):
@@ -82,7 +122,8 @@ class CongaTemplateParser:
                         
                         # Track tag locations in tables
                         for run_idx, run in enumerate(paragraph.runs):
-                            if any(pattern in run.text for pattern in ['&=', '{{', '}}', '{IF', '{TABLE', '{END']):
+                            run_text = run.text
+                            if any(pattern in run_text for pattern in _TAG_MARKERS):
                                 self.tag_locations.append({
                                     'type': 'table',
                                     'table_index': table_idx,
@@ -90,7 +131,7 @@ class CongaTemplateParser:
                                     'cell_index': cell_idx,
                                     'paragraph_index': para_idx,
                                     'run_index': run_idx,
-                                    'text': run.text,
+                                    'text': run_text,
                                     'original_run': run  # Store reference to the original run
                                 })
                     
@@ -100,17 +141,8 @@ class CongaTemplateParser:
         """
         Identify and classify Conga tags in the document
         """
-        # Patterns for different Conga tag types
-        patterns = {
-            'merge_field': r'&=([A-Za-z0-9._]+)',
-            'curly_brace_field': r'\{\{([^}]+)\}\}',
-            'conditional': r'\{IF\s+"([^"]+)"\s+([^}]+)\}',
-            'table_start': r'\{TABLE\s+([^}]+)\}',
-            'table_end': r'\{END\s+([^}]+)\}'
-        }
-        
-        for tag_type, pattern in patterns.items():
-            for match in re.finditer(pattern, self.text_content):
+        for tag_type, pattern in _TAG_PATTERNS.items():
+            for match in pattern.finditer(self.text_content):
                 self.tags.append({
                     'type': tag_type,
                     'full_match': match.group(0),
@@ -2,45 +2,12 @@
 Module for building prompts for AI-assisted template conversion.
 """
 from typing import Dict, List, Optional, Any
-from dataclasses import dataclass
 
+# Bump whenever the prompt templates change so cached AI results are invalidated
+PROMPT_VERSION = 1
 
-@dataclass
-class ConversionContext:
-    """Context for template conversion."""
-    template_text: str = ""
-    query_text: str = ""
-    schema_data: Optional[Dict[str, Any]] = None
-    custom_instructions: str = ""
-    
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert context to a dictionary."""
-        return {
-            "template_text": self.template_text,
-            "query_text": self.query_text,
-            "schema_fields": list(self.schema_data.keys()) if self.schema_data else [],
-            "custom_instructions": self.custom_instructions
-        }
-
-
-class PromptBuilder:
-    """Builder for creating prompts for AI-assisted template conversion."""
-    
-    def __init__(self, context: ConversionContext):
-        """Initialize the prompt builder with conversion context.
-        
-        Args:
-            context: Conversion context containing template and schema information
-        """
-        self.context = context
-    
-    def build_conversion_prompt(self) -> Dict[str, str]:
-        """Build a prompt for converting a Conga template to Box DocGen format.
-        
-        Returns:
-            Dict containing 'system_prompt' and 'user_prompt' strings
-        """
-        system_prompt = """You are an expert in document generation systems, specifically converting between Conga and Box DocGen templates. 
+# Prompt templates are module constants so every PromptBuilder formats the same objects
+_CONVERSION_SYSTEM_PROMPT = """You are an expert in document generation systems, specifically converting between Conga and Box DocGen templates. 
 Your task is to convert the provided Conga template to Box DocGen format while preserving all functionality.
 
 Key conversion rules:
@@ -53,7 +20,7 @@ Key conversion rules:
 Always maintain the original document structure and formatting as much as possible.
 """
 
-        user_prompt = """Please convert the following Conga template to Box DocGen format.
+_CONVERSION_USER_PROMPT = """Please convert the following Conga template to Box DocGen format.
 
 CONGA TEMPLATE:
 {template_text}
@@ -69,31 +36,7 @@ CUSTOM INSTRUCTIONS:
 
 CONVERTED TEMPLATE:"""
 
-        # Format the user prompt with the actual context
-        schema_fields = "\n- ".join(self.context.schema_data.keys()) if self.context.schema_data else ""
-        user_prompt = user_prompt.format(
-            template_text=self.context.template_text,
-            query_text=self.context.query_text or "N/A",
-            schema_fields=schema_fields,
-            custom_instructions=self.context.custom_instructions or "None"
-        )
-        
-        return {
-            "system_prompt": system_prompt,
-            "user_prompt": user_prompt
-        }
-    
-    def build_validation_prompt(self, original_text: str, converted_text: str) -> Dict[str, str]:
-        """Build a prompt for validating a converted template.
-        
-        Args:
-            original_text: Original Conga template text
-            converted_text: Converted Box DocGen template text
-            
-        Returns:
-            Dict containing 'system_prompt' and 'user_prompt' strings
-        """
-        system_prompt = """You are a meticulous quality assurance specialist for document generation systems. 
+_VALIDATION_SYSTEM_PROMPT = """You are a meticulous quality assurance specialist for document generation systems. 
 Your task is to validate that the converted Box DocGen template matches the functionality of the original Conga template.
 
 Check for:
@@ -107,7 +50,7 @@ Check for:
 Provide a detailed analysis of any issues found and suggestions for fixes.
 """
 
-        user_prompt = f"""Please validate that the following converted Box DocGen template matches the functionality of the original Conga template.
+_VALIDATION_USER_PROMPT = """Please validate that the following converted Box DocGen template matches the functionality of the original Conga template.
 
 ORIGINAL CONGA TEMPLATE:
 {original_text}
@@ -120,13 +63,89 @@ SCHEMA FIELDS (if any):
 
 VALIDATION ANALYSIS:"""
 
-        user_prompt = user_prompt.format(
+
+class ConversionContext:
+    """Context for template conversion.
+    
+    Declared with ``__slots__`` rather than as a dataclass: on Python 3.9 a
+    dataclass cannot combine slots with field defaults.
+    """
+    __slots__ = ('template_text', 'query_text', 'schema_data', 'custom_instructions')
+    
+    def __init__(self, template_text: str = "", query_text: str = "",
+                 schema_data: Optional[Dict[str, Any]] = None, custom_instructions: str = ""):
+        self.template_text = template_text
+        self.query_text = query_text
+        self.schema_data = schema_data
+        self.custom_instructions = custom_instructions
+    
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{name}={getattr(self, name)!r}" for name in self.__slots__)
+        return f"{type(self).__name__}({fields})"
+    
+    def __eq__(self, other: Any) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in self.__slots__)
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert context to a dictionary."""
+        return {
+            "template_text": self.template_text,
+            "query_text": self.query_text,
+            "schema_fields": list(self.schema_data.keys()) if self.schema_data else [],
+            "custom_instructions": self.custom_instructions
+        }
+
+
+class PromptBuilder:
+    """Builder for creating prompts for AI-assisted template conversion."""
+    
+    def __init__(self, context: ConversionContext):
+        """Initialize the prompt builder with conversion context.
+        
+        Args:
+            context: Conversion context containing template and schema information
+        """
+        self.context = context
+    
+    def build_conversion_prompt(self) -> Dict[str, str]:
+        """Build a prompt for converting a Conga template to Box DocGen format.
+        
+        Returns:
+            Dict containing 'system_prompt' and 'user_prompt' strings
+        """
+        # Format the user prompt with the actual context
+        schema_fields = "\n- ".join(self.context.schema_data.keys()) if self.context.schema_data else ""
+        user_prompt = _CONVERSION_USER_PROMPT.format(
+            template_text=self.context.template_text,
+            query_text=self.context.query_text or "N/A",
+            schema_fields=schema_fields,
+            custom_instructions=self.context.custom_instructions or "None"
+        )
+        
+        return {
+            "system_prompt": _CONVERSION_SYSTEM_PROMPT,
+            "user_prompt": user_prompt
+        }
+    
+    def build_validation_prompt(self, original_text: str, converted_text: str) -> Dict[str, str]:
+        """Build a prompt for validating a converted template.
+        
+        Args:
+            original_text: Original Conga template text
+            converted_text: Converted Box DocGen template text
+            
+        Returns:
+            Dict containing 'system_prompt' and 'user_prompt' strings
+        """
+        user_prompt = _VALIDATION_USER_PROMPT.format(
             original_text=original_text,
             converted_text=converted_text,
-            schema_fields="\n- ".join([""] + (self.context.schema_data.keys() if self.context.schema_data else []))
+            schema_fields="\n- ".join([""] + (list(self.context.schema_data.keys()) if self.context.schema_data else []))
         )
         
         return {
-            "system_prompt": system_prompt,
+            "system_prompt": _VALIDATION_SYSTEM_PROMPT,
             "user_prompt": user_prompt
         }
@@ -1,8 +1,11 @@
 """
 Module for loading and processing Conga query files.
 """
+import copy
+import functools
 import re
 import json
+import stat
 from typing import Dict, List, Optional, Any, Union
 from pathlib import Path
 
@@ -32,9 +35,14 @@ class CongaQueryLoader:
             if isinstance(query_data, dict):
                 self.queries = query_data
             elif isinstance(query_data, (str, Path)):
-                # Try to load from file if path exists
+                # Try to load from file if path exists; one stat answers both
+                # questions, and query text too long to be a file name is not an error
                 path = Path(query_data)
-                if path.exists() and path.is_file():
+                try:
+                    is_file = stat.S_ISREG(path.stat().st_mode)
+                except (OSError, ValueError):
+                    is_file = False
+                if is_file:
                     with open(path, 'r', encoding='utf-8') as f:
                         content = f.read()
                         # Try to parse as JSON first
@@ -92,7 +100,31 @@ class CongaQueryLoader:
         """
         if not query:
             return {}
+        
+        # Parsed once per normalized query; copied so callers can modify the result
+        return copy.deepcopy(_parse_query_metadata(' '.join(query.split())))
+    
+    def get_query_components(self, query_name: str = 'default') -> Dict[str, Any]:
+        """Get the parsed components of a query.
+        
+        Args:
+            query_name: Name of the query
             
+        Returns:
+            Dict containing extracted metadata, empty if the query is not found
+        """
+        return self.extract_query_metadata(self.get_query(query_name))
+    
+    @staticmethod
+    def _parse_metadata(query: str) -> Dict[str, Any]:
+        """Parse metadata from a whitespace-normalized SOQL/SOSL query.
+        
+        Args:
+            query: The normalized query string
+            
+        Returns:
+            Dict containing extracted metadata
+        """
         metadata = {
             'type': 'unknown',
             'object': None,
@@ -103,9 +135,6 @@ class CongaQueryLoader:
             'is_count': False
         }
         
-        # Normalize whitespace
-        query = ' '.join(query.split())
-        
         # Check query type
         query_upper = query.upper()
         
@@ -132,7 +161,7 @@ class CongaQueryLoader:
                                  query_upper, re.IGNORECASE | re.DOTALL)
             if where_match:
                 where_clause = query[where_match.start(1):where_match.end(1)]
-                metadata['conditions'] = self._extract_conditions(where_clause)
+                metadata['conditions'] = CongaQueryLoader._extract_conditions(where_clause)
             
             # Extract ORDER BY
             order_match = re.search(r'ORDER BY\s+(.*?)(?:\s+LIMIT|\s+OFFSET|\s*$)', 
@@ -152,7 +181,8 @@ class CongaQueryLoader:
         
         return metadata
     
-    def _extract_conditions(self, where_clause: str) -> List[Dict[str, Any]]:
+    @staticmethod
+    def _extract_conditions(where_clause: str) -> List[Dict[str, Any]]:
         """Extract conditions from a WHERE clause.
         
         Args:
@@ -217,3 +247,16 @@ class CongaQueryLoader:
             fields.add(field)
         
         return sorted(f for f in fields if f)
+
+
+@functools.lru_cache(maxsize=128)
+def _parse_query_metadata(query: str) -> Dict[str, Any]:
+    """Parse query metadata once per normalized query string.
+    
+    Args:
+        query: The whitespace-normalized query string
+        
+    Returns:
+        Shared metadata dict; callers must copy it before modifying
+    """
+    return CongaQueryLoader._parse_metadata(query)
@@ -2,9 +2,31 @@
 Module for parsing AI responses for template conversion.
 """
 import re
-import json
 from typing import Dict, List, Optional, Any, Tuple
 
+# Prefer orjson for parsing AI responses; fall back to the standard library
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:  # pragma: no cover
+    import json
+    _loads = json.loads
+
+# Leading '{' after optional whitespace; matched without copying the response
+_JSON_OBJECT_START = re.compile(r'\s*\{')
+
+
+def _looks_like_json_object(response: Any) -> bool:
+    """Check cheaply whether a response could be a JSON object.
+    
+    Args:
+        response: Raw response from the AI
+        
+    Returns:
+        True if the response is a string starting with '{' (ignoring leading whitespace)
+    """
+    return isinstance(response, str) and _JSON_OBJECT_START.match(response) is not None
+
 
 class AIResponseParser:
     """Parser for AI responses related to template conversion."""
@@ -27,19 +49,21 @@ class AIResponseParser:
             'metadata': {}
         }
         
-        # Try to parse as JSON first (if the AI returns a structured response)
-        try:
-            data = json.loads(response)
-            if isinstance(data, dict):
-                result.update({
-                    'content': data.get('content', ''),
-                    'warnings': data.get('warnings', []),
-                    'confidence': float(data.get('confidence', 1.0)),
-                    'metadata': data.get('metadata', {})
-                })
-                return result
-        except (json.JSONDecodeError, TypeError):
-            pass
+        # Try to parse as JSON first (if the AI returns a structured response);
+        # plain-text answers are not run through the decoder at all
+        if _looks_like_json_object(response):
+            try:
+                data = _loads(response)
+                if isinstance(data, dict):
+                    result.update({
+                        'content': data.get('content', ''),
+                        'warnings': data.get('warnings', []),
+                        'confidence': float(data.get('confidence', 1.0)),
+                        'metadata': data.get('metadata', {})
+                    })
+                    return result
+            except (ValueError, TypeError):
+                pass
         
         # If not JSON or parsing failed, treat the entire response as content
         result['content'] = response.strip()
@@ -85,18 +109,19 @@ class AIResponseParser:
         }
         
         # Try to parse as JSON first
-        try:
-            data = json.loads(response)
-            if isinstance(data, dict):
-                result.update({
-                    'is_valid': data.get('is_valid', True),
-                    'issues': data.get('issues', []),
-                    'confidence': float(data.get('confidence', 1.0)),
-                    'suggestions': data.get('suggestions', [])
-                })
-                return result
-        except (json.JSONDecodeError, TypeError):
-            pass
+        if _looks_like_json_object(response):
+            try:
+                data = _loads(response)
+                if isinstance(data, dict):
+                    result.update({
+                        'is_valid': data.get('is_valid', True),
+                        'issues': data.get('issues', []),
+                        'confidence': float(data.get('confidence', 1.0)),
+                        'suggestions': data.get('suggestions', [])
+                    })
+                    return result
+            except (ValueError, TypeError):
+                pass
         
         # If not JSON, try to parse the response text
         # Look for validation results in the text
@@ -1,14 +1,38 @@
 """
 Module for loading and validating JSON schemas for template conversion.
 """
-import json
+import functools
 import os
+import stat
 from typing import Dict, List, Optional, Any, Union
 from pathlib import Path
 
+# Prefer orjson for parsing schemas; fall back to the standard library
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:  # pragma: no cover
+    import json
+    _loads = json.loads
+
 __all__ = ['JSONSchemaLoader']
 
 
+@functools.lru_cache(maxsize=8)
+def _read_schema_file(path: str, mtime: float) -> Dict[str, Any]:
+    """Read a schema file once per (path, modification time).
+    
+    Args:
+        path: Path to the JSON schema file
+        mtime: Modification time of the file, so edits invalidate the entry
+        
+    Returns:
+        Parsed schema, shared between loaders and not to be modified
+    """
+    with open(path, 'rb') as f:
+        return _loads(f.read())
+
+
 class JSONSchemaLoader:
     """Loader for JSON schemas used in template validation."""
     
@@ -34,15 +58,19 @@ class JSONSchemaLoader:
             if isinstance(schema_data, dict):
                 self.schema = schema_data
             elif isinstance(schema_data, (str, Path)):
-                # Try to load from file if path exists
+                # Try to load from file if path exists; one stat answers both
+                # questions, and JSON text too long to be a file name is not an error
                 path = Path(schema_data)
-                if path.exists() and path.is_file():
-                    with open(path, 'r', encoding='utf-8') as f:
-                        self.schema = json.load(f)
+                try:
+                    path_stat = path.stat()
+                except (OSError, ValueError):
+                    path_stat = None
+                if path_stat is not None and stat.S_ISREG(path_stat.st_mode):
+                    self.schema = _read_schema_file(str(path), path_stat.st_mtime)
                 else:
                     # Try to parse as JSON string
-                    self.schema = json.loads(str(schema_data))
-        except (json.JSONDecodeError, TypeError) as e:
+                    self.schema = _loads(str(schema_data))
+        except (ValueError, TypeError) as e:
             raise ValueError(f"Invalid schema data: {str(e)}")
     
     def validate_against_schema(self, data: Dict) -> Dict[str, Any]:
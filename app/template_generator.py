@@ -1,6 +1,7 @@
 """
 Module for generating Box DocGen templates from various sources.
 """
+import io
 from typing import Dict, List, Optional, Any, Union
 from pathlib import Path
 
@@ -14,7 +15,18 @@ class DocGenTemplateGenerator:
     
     def __init__(self):
         """Initialize the template generator."""
-        self.document = Document()
+        self._document: Optional[DocumentType] = None
+    
+    @property
+    def document(self) -> DocumentType:
+        """The document being built, created on first use.
+        
+        create_from_ai_output builds its own document, so generators used only
+        for that never pay for loading python-docx's default template.
+        """
+        if self._document is None:
+            self._document = Document()
+        return self._document
     
     def create_from_ai_output(self, ai_output: str) -> DocumentType:
         """Create a document from AI-generated output.
@@ -49,6 +61,19 @@ class DocGenTemplateGenerator:
         """
         doc.save(file_path)
     
+    def to_bytes(self, doc: DocumentType) -> bytes:
+        """Serialize the document to DOCX bytes without touching the disk.
+        
+        Args:
+            doc: The document to serialize
+            
+        Returns:
+            bytes: The DOCX file contents
+        """
+        buffer = io.BytesIO()
+        doc.save(buffer)
+        return buffer.getvalue()
+    
     def add_section(self, title: str, level: int = 1) -> None:
         """Add a section to the document.
         
@@ -154,4 +179,4 @@ class DocGenTemplateGenerator:
     
     def clear(self) -> None:
         """Clear the current document content."""
-        self.document = Document()
+        self._document = None
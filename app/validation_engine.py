@@ -5,15 +5,19 @@ This module provides functionality to validate the syntax and semantics of
 Box DocGen templates, including checking for proper Handlebars syntax,
 field references, and template structure.
 """
+import asyncio
 import re
-from typing import Dict, List, Optional, Any, Tuple, Set
+from typing import TYPE_CHECKING, Dict, List, Optional, Any, Tuple, Set
 
-from boxsdk import Client
-
-from app.box_ai_client import BoxAIClient
 from app.prompt_builder import PromptBuilder, ConversionContext
 from app.response_parser import AIResponseParser
 
+if TYPE_CHECKING:
+    from app.box_ai_client import BoxAIClient
+
+# validation_method of results where AI validation failed and the rules were used instead
+AI_FALLBACK_METHOD = 'ai_fallback_to_rules'
+
 
 class ValidationEngine:
     """Engine for validating Box DocGen templates.
@@ -24,7 +28,7 @@ class ValidationEngine:
     more advanced validation when available.
     """
     
-    def __init__(self, box_ai_client: Optional[BoxAIClient] = None):
+    def __init__(self, box_ai_client: Optional['BoxAIClient'] = None):
         """Initialize the validation engine.
         
         Args:
@@ -289,20 +293,15 @@ class ValidationEngine:
             schema_fields: Set of fields defined in the schema
             warnings: List to append any warnings to
         """
-        lines = template_text.split('\n')
-        
         for ref in field_refs:
             # Skip built-in and special fields
             if ref.startswith('@') or ref in ['this', 'root']:
                 continue
                 
             if ref not in schema_fields:
-                # Find the line number for the reference
-                line_num = 1
-                for i, line in enumerate(lines, 1):
-                    if ref in line:
-                        line_num = i
-                        break
+                # Find the line number of the first occurrence without re-scanning every line
+                pos = template_text.find(ref)
+                line_num = template_text.count('\n', 0, pos) + 1 if pos >= 0 else 1
                 
                 warnings.append({
                     'line': line_num,
@@ -392,6 +391,61 @@ class ValidationEngine:
             return self._validate_with_ai(original_text, converted_text, context or {})
         return self._validate_with_rules(original_text, converted_text, context or {})
     
+    def validate_batch(
+        self,
+        pairs: List[Tuple[str, str]],
+        context: Optional[Dict[str, Any]] = None,
+        max_concurrency: int = 8
+    ) -> List[Dict[str, Any]]:
+        """Validate several conversions at once.
+        
+        With an AI client the validation requests are sent concurrently
+        instead of one after another; otherwise each pair is checked with
+        the rule-based validation.
+        
+        Args:
+            pairs: (original_text, converted_text) tuples to validate
+            context: Optional context shared by all pairs, as for validate_conversion
+            max_concurrency: Maximum number of Box AI requests in flight at once
+            
+        Returns:
+            List of validation results in the same order as the input
+        """
+        context = context or {}
+        if not self.box_ai_client:
+            return [self._validate_with_rules(original, converted, context) for original, converted in pairs]
+        return asyncio.run(self._validate_many_with_ai(pairs, context, max_concurrency))
+    
+    async def _validate_many_with_ai(
+        self,
+        pairs: List[Tuple[str, str]],
+        context: Dict[str, Any],
+        max_concurrency: int
+    ) -> List[Dict[str, Any]]:
+        """Validate several conversions with concurrent Box AI requests.
+        
+        Args:
+            pairs: (original_text, converted_text) tuples to validate
+            context: Context for validation including schema and instructions
+            max_concurrency: Maximum number of Box AI requests in flight at once
+            
+        Returns:
+            List of validation results in the same order as the input
+        """
+        from app.box_ai_client import AsyncBoxAIClient
+        client = AsyncBoxAIClient(self.box_ai_client, max_concurrency=max_concurrency)
+        # The schema and instructions are shared, so the prompt builder is built once
+        prompt_builder = self._validation_prompt_builder(context)
+        
+        async def validate(original_text: str, converted_text: str) -> Dict[str, Any]:
+            try:
+                request = self._ai_validation_request(original_text, converted_text, prompt_builder)
+                return self._ai_validation_result(await client.generate_text(**request))
+            except Exception as e:
+                return self._ai_fallback(original_text, converted_text, context, e)
+        
+        return await asyncio.gather(*(validate(original, converted) for original, converted in pairs))
+    
     def _validate_with_ai(
         self, 
         original_text: str, 
@@ -413,46 +467,98 @@ class ValidationEngine:
             Dict containing AI-based validation results
         """
         try:
-            # Create a conversion context
-            conv_context = ConversionContext(
-                template_text=original_text,
-                schema_data=context.get('schema'),
-                custom_instructions=context.get('instructions', '')
-            )
-            
-            # Build the validation prompt
-            prompt_builder = PromptBuilder(conv_context)
-            prompts = prompt_builder.build_validation_prompt(
-                original_text, 
-                converted_text
-            )
+            prompt_builder = self._validation_prompt_builder(context)
+            request = self._ai_validation_request(original_text, converted_text, prompt_builder)
+            return self._ai_validation_result(self.box_ai_client.generate_text(**request))
+        except Exception as e:
+            # Fall back to rules-based validation if AI validation fails
+            return self._ai_fallback(original_text, converted_text, context, e)
+    
+    def _validation_prompt_builder(self, context: Dict[str, Any]) -> PromptBuilder:
+        """Create the prompt builder for validating conversions under one context.
+        
+        The validation prompt only depends on the schema and instructions in the
+        context, so one builder serves every conversion validated with it.
+        
+        Args:
+            context: Context for validation including schema and instructions
             
-            # Get AI response
-            response = self.box_ai_client.generate_text(
-                prompt=prompts['user_prompt'],
-                system_prompt=prompts['system_prompt']
-            )
+        Returns:
+            PromptBuilder for build_validation_prompt
+        """
+        return PromptBuilder(ConversionContext(
+            schema_data=context.get('schema'),
+            custom_instructions=context.get('instructions', '')
+        ))
+    
+    def _ai_validation_request(
+        self,
+        original_text: str,
+        converted_text: str,
+        prompt_builder: PromptBuilder
+    ) -> Dict[str, Any]:
+        """Build the generate_text arguments for validating a conversion with Box AI.
+        
+        Args:
+            original_text: Original template text before conversion
+            converted_text: Converted template text to validate
+            prompt_builder: Builder from _validation_prompt_builder
             
-            # Parse the response
-            parser = AIResponseParser()
-            result = parser.parse_validation_result(response)
+        Returns:
+            Dict: Keyword arguments for BoxAIClient.generate_text
+        """
+        prompts = prompt_builder.build_validation_prompt(
+            original_text, 
+            converted_text
+        )
+        return {
+            'prompt': prompts['user_prompt'],
+            'system_prompt': prompts['system_prompt']
+        }
+    
+    def _ai_validation_result(self, response: Dict[str, Any]) -> Dict[str, Any]:
+        """Turn a Box AI validation response into validation results.
+        
+        Args:
+            response: JSON response returned by BoxAIClient.generate_text
             
-            return {
-                'is_valid': result.get('is_valid', False),
-                'confidence': min(max(result.get('confidence', 0.5), 0.0), 1.0),
-                'issues': result.get('issues', []),
-                'suggestions': result.get('suggestions', []),
-                'ai_analysis': response,
-                'validation_method': 'ai'
-            }
+        Returns:
+            Dict containing AI-based validation results
+        """
+        result = AIResponseParser.parse_validation_result(response.get('answer', ''))
+        
+        return {
+            'is_valid': result.get('is_valid', False),
+            'confidence': min(max(result.get('confidence', 0.5), 0.0), 1.0),
+            'issues': result.get('issues', []),
+            'suggestions': result.get('suggestions', []),
+            'ai_analysis': response,
+            'validation_method': 'ai'
+        }
+    
+    def _ai_fallback(
+        self,
+        original_text: str,
+        converted_text: str,
+        context: Dict[str, Any],
+        error: Exception
+    ) -> Dict[str, Any]:
+        """Rule-based validation results for a conversion whose AI validation failed.
+        
+        Args:
+            original_text: Original template text before conversion
+            converted_text: Converted template text to validate
+            context: Context for validation
+            error: Exception raised by the AI validation
             
-        except Exception as e:
-            # Fall back to rules-based validation if AI validation fails
-            return {
-                **self._validate_with_rules(original_text, converted_text, context),
-                'ai_error': str(e),
-                'validation_method': 'ai_fallback_to_rules'
-            }
+        Returns:
+            Dict containing rule-based validation results and the AI error
+        """
+        return {
+            **self._validate_with_rules(original_text, converted_text, context),
+            'ai_error': str(error),
+            'validation_method': AI_FALLBACK_METHOD
+        }
     
     def _validate_with_rules(
         self, 
@@ -20,9 +20,10 @@ install_requires = [
     'importlib-metadata>=1.0.0'  # Required for Python < 3.8
 ]
 
-# Make tiktoken optional
+# Make tiktoken and orjson optional
 optional_deps = {
-    'ai': ['tiktoken==0.5.2; python_version < "3.12" and platform_system != "Windows"']
+    'ai': ['tiktoken==0.5.2; python_version < "3.12" and platform_system != "Windows"'],
+    'fast': ['orjson>=3.9']
 }
 
 setup(
@@ -35,11 +36,12 @@ setup(
     entry_points={
         "console_scripts": [
             "conga-converter=app.app:main",
+            "conga-app=app.__main__:main",
         ],
     },
     include_package_data=True,
     package_data={
-        'app': ['*.json', '*.md', '*.txt'],
+        'app': ['*.json', '*.md', '*.txt', '*.pyi'],
     },
     zip_safe=False,
 )
@@ -0,0 +1,55 @@
+"""
+Tests for the Streamlit conversion flow in app.app
+"""
+import docx
+from streamlit.testing.v1 import AppTest
+
+
+def _convert_path(path):
+    """Script run by AppTest: convert a template given as a file path."""
+    import streamlit as st
+    from app.app import process_conversion
+
+    process_conversion(uploaded_file=path, validate_output=False)
+    st.write(st.session_state.uploaded_file_name, st.session_state.converted_doc_name)
+
+
+def test_process_conversion_accepts_path(tmp_path):
+    template = docx.Document()
+    template.add_paragraph('Dear &=Contact.Name&')
+    path = tmp_path / 'letter.docx'
+    template.save(path)
+
+    at = AppTest.from_function(_convert_path, args=(str(path),), default_timeout=30).run()
+
+    assert not at.exception
+    assert not at.error
+    assert at.markdown[0].value == 'letter.docx converted_letter.docx'
+    assert at.session_state.converted_doc
+
+
+def test_developer_token_config_builds_client(monkeypatch):
+    from app import app as app_module
+    from app.box_ai_client import BoxAIClient
+
+    class FakeUser:
+        name = 'Dev User'
+        login = 'dev@example.com'
+
+    class FakeClient:
+        def __init__(self, auth):
+            self.auth = auth
+
+        def user(self, user_id):
+            return self
+
+        def get(self):
+            return FakeUser()
+
+    # Stand in for the Box API so the token check needs no network
+    monkeypatch.setattr(BoxAIClient, '_make_client', staticmethod(FakeClient))
+
+    client = BoxAIClient(app_module._developer_token_config('dev-token-0123456789'))
+
+    assert client.client.auth.access_token == 'dev-token-0123456789'
+    assert client.authenticated_user['login'] == 'dev@example.com'
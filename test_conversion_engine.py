@@ -0,0 +1,68 @@
+"""
+Tests for the rule-based document conversion in ConversionEngine
+"""
+import io
+from xml.sax.saxutils import escape
+
+import docx
+from docx.oxml import parse_xml
+from docx.oxml.ns import nsdecls, qn
+
+from app.conversion_engine import ConversionEngine, convert_docx_bytes
+
+
+def _add_hyperlink(paragraph, text):
+    """Append a w:hyperlink holding one run with the given text."""
+    paragraph._p.append(parse_xml(
+        f'<w:hyperlink {nsdecls("w", "r")} r:id="rId99"><w:r><w:t xml:space="preserve">{escape(text)}</w:t></w:r></w:hyperlink>'
+    ))
+
+
+def _reload(doc):
+    """Save a document to bytes and open the result."""
+    buffer = io.BytesIO()
+    doc.save(buffer)
+    buffer.seek(0)
+    return docx.Document(buffer)
+
+
+def test_convert_document_rewrites_hyperlink_runs():
+    doc = docx.Document()
+    mixed = doc.add_paragraph('Hello &=Name& ')
+    _add_hyperlink(mixed, 'LINK')
+    link_only = doc.add_paragraph()
+    _add_hyperlink(link_only, '&=Url&')
+
+    # Read the input's paragraphs first, as CongaTemplateParser.parse() does
+    assert [p.text for p in doc.paragraphs] == ['Hello &=Name& LINK', '&=Url&']
+
+    converted = ConversionEngine().convert_document(doc)
+
+    # Check what is actually saved, not just the in-memory proxies
+    exported = _reload(converted)
+    assert [p.text for p in exported.paragraphs] == ['Hello {{Name}} LINK', '{{Url}}']
+    hyperlink_text = [
+        ''.join(t.text for t in link.iter(qn('w:t')))
+        for link in exported.element.body.iter(qn('w:hyperlink'))
+    ]
+    assert hyperlink_text == ['', '{{Url}}']
+    # The input document is left untouched
+    assert [p.text for p in _reload(doc).paragraphs] == ['Hello &=Name& LINK', '&=Url&']
+
+
+def test_convert_docx_bytes_exports_converted_template():
+    template = docx.Document()
+    greeting = template.add_paragraph('Dear ')
+    greeting.add_run('&=Contact.')
+    greeting.add_run('Name&,')
+    template.add_table(rows=1, cols=1).cell(0, 0).text = 'Total: &=Opportunity.Amount&'
+    buffer = io.BytesIO()
+    template.save(buffer)
+
+    converted_bytes, original_text, converted_text = convert_docx_bytes(buffer.getvalue())
+
+    assert original_text == 'Dear &=Contact.Name&,'
+    assert converted_text == 'Dear {{Contact.Name}},'
+    exported = docx.Document(io.BytesIO(converted_bytes))
+    assert [p.text for p in exported.paragraphs] == ['Dear {{Contact.Name}},']
+    assert exported.tables[0].cell(0, 0).text == 'Total: {{Opportunity.Amount}}'
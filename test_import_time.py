@@ -0,0 +1,91 @@
+"""
+Tests for the lazy-loading behaviour of the app package
+"""
+import ast
+import importlib
+import os
+import subprocess
+import sys
+
+# Submodules that must only load on first attribute access
+DEFERRED_MODULES = (
+    'app.box_ai_client',
+    'app.conversion_engine',
+    'app.schema_loader',
+    'app.template_generator',
+    'app.parser',
+    'app.exporter'
+)
+
+# Heavy third-party packages that `import app` must not pull in; checked by
+# presence rather than wall-clock time so the test is stable on loaded machines
+DEFERRED_PACKAGES = ('streamlit', 'docx', 'boxsdk', 'lxml', 'requests')
+
+
+def _fresh_app(monkeypatch):
+    """Import a fresh copy of the app package with nothing resolved yet."""
+    monkeypatch.delitem(sys.modules, 'app', raising=False)
+    return importlib.import_module('app')
+
+
+def test_getattr_called_once_per_name(monkeypatch):
+    app = _fresh_app(monkeypatch)
+    
+    calls = []
+    original_getattr = app.__getattr__
+    
+    def counting_getattr(name):
+        calls.append(name)
+        return original_getattr(name)
+    
+    monkeypatch.setattr(app, '__getattr__', counting_getattr)
+    
+    for _ in range(3):
+        assert app.ConversionContext is not None
+        assert getattr(app, 'AIResponseParser', None) is not None
+    
+    assert calls == ['ConversionContext', 'AIResponseParser']
+
+
+def _import_times():
+    """Run `import app` under -X importtime and return {module: cumulative_us}."""
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', 'import app'],
+        cwd=os.path.dirname(os.path.abspath(__file__)),
+        capture_output=True,
+        text=True,
+        check=True
+    )
+    
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, module = line[len('import time:'):].split('|')
+        times[module.strip()] = int(cumulative)
+    return times
+
+
+def test_import_app_defers_submodules():
+    times = _import_times()
+    
+    loaded = [name for name in DEFERRED_MODULES if name in times]
+    assert not loaded, f"`import app` eagerly loaded: {loaded}"
+    
+    packages = sorted({name.split('.')[0] for name in times}.intersection(DEFERRED_PACKAGES))
+    assert not packages, f"`import app` eagerly loaded: {packages}"
+
+
+def test_stub_matches_lazy_exports():
+    import app
+    
+    stub_path = os.path.join(os.path.dirname(app.__file__), '__init__.pyi')
+    with open(stub_path, encoding='utf-8') as f:
+        tree = ast.parse(f.read())
+    
+    stubbed = {
+        alias.asname: node.module
+        for node in tree.body if isinstance(node, ast.ImportFrom)
+        for alias in node.names
+    }
+    assert stubbed == {name: module.lstrip('.') for name, module in app._MODULE_FOR.items()}